@@ -3,7 +3,7 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 from uuid import uuid4
 
 from loguru import logger
@@ -22,6 +22,16 @@ class TaskStatus(Enum):
     PAUSED = "paused"
 
 
+# Display icon per status, shared by step summaries and task list labels
+_STATUS_ICONS = {
+    TaskStatus.PENDING: "○",
+    TaskStatus.IN_PROGRESS: "⟳",
+    TaskStatus.COMPLETED: "✓",
+    TaskStatus.FAILED: "✗",
+    TaskStatus.PAUSED: "⏸",
+}
+
+
 @dataclass
 class TaskStep:
     """A single step within a task."""
@@ -53,14 +63,7 @@ class TaskStep:
     @property
     def status_icon(self) -> str:
         """Get status icon for display."""
-        icons = {
-            TaskStatus.PENDING: "○",
-            TaskStatus.IN_PROGRESS: "⟳",
-            TaskStatus.COMPLETED: "✓",
-            TaskStatus.FAILED: "✗",
-            TaskStatus.PAUSED: "⏸",
-        }
-        return icons.get(self.status, "?")
+        return _STATUS_ICONS.get(self.status, "?")
 
 
 @dataclass
@@ -75,6 +78,8 @@ class AgentTask:
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
     context: str = ""  # Additional context for execution
+    _label_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _list_label: str = field(default="", init=False, repr=False, compare=False)
 
     @property
     def current_step(self) -> Optional[TaskStep]:
@@ -96,6 +101,15 @@ class AgentTask:
         completed = sum(1 for s in self.steps if s.status == TaskStatus.COMPLETED)
         return int((completed / len(self.steps)) * 100)
 
+    @property
+    def list_label(self) -> str:
+        """Get short icon + goal label for task lists (rebuilt only on change)."""
+        key = (self.status, self.goal)
+        if key != self._label_key:
+            self._label_key = key
+            self._list_label = f"{_STATUS_ICONS.get(self.status, '?')} {self.goal[:40]}"
+        return self._list_label
+
     def advance(self):
         """Move to next step."""
         self.current_step_index += 1
@@ -122,8 +136,32 @@ class TaskPlanner:
     def __init__(self):
         self.active_tasks: dict[str, AgentTask] = {}
         self.completed_tasks: list[AgentTask] = []
+        self._completed_by_id: dict[str, AgentTask] = {}
+        # Bumped on every task/step change so views can skip no-op refreshes
+        self.version = 0
+        self._change_callbacks: List[Callable[[], None]] = []
         logger.info("TaskPlanner initialized")
 
+    def on_tasks_changed(self, callback: Callable[[], None]):
+        """Register a callback invoked whenever a task or step changes."""
+        self._change_callbacks.append(callback)
+
+    def remove_tasks_changed_callback(self, callback: Callable[[], None]):
+        """Remove a previously registered change callback."""
+        try:
+            self._change_callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def _changed(self):
+        """Bump the version and notify change callbacks."""
+        self.version += 1
+        for cb in self._change_callbacks:
+            try:
+                cb()
+            except Exception:
+                logger.exception("Task change callback failed")
+
     async def create_plan(
         self,
         goal: str,
@@ -189,6 +227,7 @@ Do not include any other text, just the numbered list."""
         task.status = TaskStatus.PENDING
 
         self.active_tasks[task.task_id] = task
+        self._changed()
         logger.info(f"Created plan with {len(steps)} steps for task {task.task_id}")
         return task
 
@@ -230,6 +269,7 @@ Do not include any other text, just the numbered list."""
         task.status = TaskStatus.IN_PROGRESS
         if task.steps:
             task.steps[0].start()
+        self._changed()
         logger.info(f"Started task {task.task_id}: {task.goal}")
 
     def complete_step(self, task: AgentTask, result: str = ""):
@@ -244,11 +284,12 @@ Do not include any other text, just the numbered list."""
 
         task.advance()
 
-        if not task.is_complete and task.current_step:
-            task.current_step.start()
-
         if task.is_complete:
-            self._finish_task(task)
+            self._finish_task(task)  # notifies
+            return
+        if task.current_step:
+            task.current_step.start()
+        self._changed()
 
     def fail_step(self, task: AgentTask, error: str = ""):
         """Mark current step as failed.
@@ -273,6 +314,7 @@ Do not include any other text, just the numbered list."""
         task = self.active_tasks.get(task_id)
         if task and task.status == TaskStatus.IN_PROGRESS:
             task.status = TaskStatus.PAUSED
+            self._changed()
             logger.info(f"Paused task {task_id}")
 
     def cancel_task(self, task_id: str):
@@ -286,6 +328,8 @@ Do not include any other text, just the numbered list."""
             task.status = TaskStatus.FAILED
             task.completed_at = datetime.now()
             self.completed_tasks.append(task)
+            self._completed_by_id[task_id] = task
+            self._changed()
             logger.info(f"Cancelled task {task_id}")
 
     def _finish_task(self, task: AgentTask):
@@ -296,9 +340,17 @@ Do not include any other text, just the numbered list."""
         """
         self.active_tasks.pop(task.task_id, None)
         self.completed_tasks.append(task)
+        self._completed_by_id[task.task_id] = task
         # Keep only last 50 completed tasks
         if len(self.completed_tasks) > 50:
+            for old in self.completed_tasks[:-50]:
+                self._completed_by_id.pop(old.task_id, None)
             self.completed_tasks = self.completed_tasks[-50:]
+        self._changed()
+
+    def get_task(self, task_id: str) -> Optional[AgentTask]:
+        """Get an active or completed task by ID."""
+        return self.active_tasks.get(task_id) or self._completed_by_id.get(task_id)
 
     def get_active_tasks(self) -> list[AgentTask]:
         """Get all active tasks."""
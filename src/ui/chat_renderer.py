@@ -8,6 +8,7 @@ Handles:
 """
 import re
 import html as html_module
+from functools import lru_cache
 
 import markdown
 from pygments import highlight
@@ -298,9 +299,13 @@ def _process_thinking_blocks(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=128)
 def render_markdown(raw_text: str) -> str:
     """Convert raw AI response text into fully styled HTML.
 
+    Cached by input text, so re-rendering an unchanged message (session
+    reload, repeated set_text) skips the markdown + Pygments pipeline.
+
     Pipeline:
       1. Extract and convert <think> blocks
       2. Syntax‑highlight fenced code blocks (before markdown to avoid conflicts)
@@ -2,7 +2,7 @@
 import asyncio
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 
@@ -527,6 +527,7 @@ class ChatWidget(QWidget):
         scroll.setFrameShape(QFrame.Shape.NoFrame)
 
         self.messages_container = QWidget()
+        self.messages_container.setStyleSheet(MessageBubble.STYLESHEET)
         self.messages_layout = QVBoxLayout(self.messages_container)
         self.messages_layout.setContentsMargins(28, 24, 28, 24)
         self.messages_layout.setSpacing(20)
@@ -798,11 +799,33 @@ class ChatWidget(QWidget):
         self._scroll_to_bottom()
         return bubble
 
+    def add_messages_bulk(self, messages: List[Tuple[str, bool]]):
+        """Add many (text, is_user) messages at once, e.g. restoring a session.
+
+        Painting is held off until every bubble is in place, so the chat lays
+        out and repaints once instead of once per message.
+        """
+        if not messages:
+            return
+        if not self._has_messages:
+            self._has_messages = True
+            self._content_stack.setCurrentIndex(1)
+        bubbles = [MessageBubble(text, is_user) for text, is_user in messages]
+        self.messages_container.setUpdatesEnabled(False)
+        try:
+            for bubble in bubbles:
+                self.messages_layout.insertWidget(
+                    self.messages_layout.count() - 1, bubble
+                )
+        finally:
+            self.messages_container.setUpdatesEnabled(True)
+        self._scroll_to_bottom()
+
     def begin_ai_response(self) -> MessageBubble:
         if not self._has_messages:
             self._has_messages = True
             self._content_stack.setCurrentIndex(1)
-        bubble = MessageBubble("", is_user=False)
+        bubble = MessageBubble("", is_user=False, streaming=True)
         self._current_ai_bubble = bubble
         self.messages_layout.insertWidget(
             self.messages_layout.count() - 1, bubble
@@ -816,6 +839,8 @@ class ChatWidget(QWidget):
             self._scroll_to_bottom()
 
     def finish_ai_response(self):
+        if self._current_ai_bubble is not None:
+            self._current_ai_bubble.finalize()
         self._current_ai_bubble = None
 
     def add_typing_indicator(self):
@@ -1033,10 +1058,9 @@ class MainWindow(QMainWindow):
         messages = await self.orchestrator.memory.get_recent_messages(
             limit=50, session_id=session_id
         )
-        for msg in messages:
-            self.chat_widget.add_message(
-                msg["content"], is_user=(msg["role"] == "user")
-            )
+        self.chat_widget.add_messages_bulk(
+            [(msg["content"], msg["role"] == "user") for msg in messages]
+        )
         self.sidebar.highlight_session(session_id)
         self._update_status()
         logger.info(f"Switched to session: {session_id}")
@@ -1424,6 +1448,8 @@ class MainWindow(QMainWindow):
         self._screen_service.interval = config.screen_capture_interval
 
     def closeEvent(self, event):
+        # The orchestrator's planner outlives the panel; stop it calling back
+        self.tasks_panel.set_task_planner(None)
         self._screen_service.stop()
         self._speech_service.shutdown()
         asyncio.create_task(self.orchestrator.close())
@@ -1,12 +1,24 @@
 """Settings dialog for NVIDIA AI Agent."""
 import asyncio
+import contextlib
+import functools
+import re
 from pathlib import Path
-from typing import Optional
-
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from typing import TYPE_CHECKING, Optional
+
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QEvent,
+    QSortFilterProxyModel,
+    QStringListModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
+    QCompleter,
     QDialog,
     QDialogButtonBox,
     QFileDialog,
@@ -25,8 +37,264 @@ from PyQt6.QtWidgets import (
 )
 from loguru import logger
 
-from src.core.agent import AgentOrchestrator
-from src.utils.secure_storage import SecureStorage
+if TYPE_CHECKING:
+    from src.core.agent import AgentOrchestrator
+
+# Project .env that saved settings are written back to
+ENV_PATH = Path(__file__).resolve().parent.parent.parent / ".env"
+
+
+@functools.cache
+def _env_key_re(key: str) -> re.Pattern:
+    """Compiled pattern matching a key's assignment line in .env."""
+    return re.compile(rf"^[ \t]*{re.escape(key)}[ \t]*=[^\r\n]*", re.MULTILINE)
+
+
+# Status label colours, parsed once per label; updates only flip "state"
+_STATUS_QSS = (
+    'QLabel[state="ok"] { color: #FF8C42; }'
+    'QLabel[state="err"] { color: #FF4500; }'
+    'QLabel[state="busy"] { color: #FFA500; }'
+    'QLabel[state="online"] { color: #4CAF50; }'
+)
+
+# Models offered in the Model tab (the combo stays editable for custom IDs)
+MODEL_IDS: tuple[str, ...] = (
+    # --- Meta Llama ---
+    "meta/llama-3.1-8b-instruct",
+    "meta/llama-3.1-70b-instruct",
+    "meta/llama-3.2-1b-instruct",
+    "meta/llama-3.2-3b-instruct",
+    "meta/llama-3.2-11b-vision-instruct",
+    "meta/llama-3.2-90b-vision-instruct",
+    "meta/llama-3.3-70b-instruct",
+    "meta/llama-4-maverick-17b-128e-instruct",
+    "meta/llama-4-scout-17b-16e-instruct",
+    "meta/llama-guard-4-12b",
+    "meta/llama3-70b-instruct",
+    "meta/llama3-8b-instruct",
+    # --- Mistral ---
+    "mistralai/devstral-2-123b-instruct-2512",
+    "mistralai/magistral-small-2506",
+    "mistralai/mamba-codestral-7b-v0.1",
+    "mistralai/mathstral-7b-v0.1",
+    "mistralai/ministral-14b-instruct-2512",
+    "mistralai/mistral-7b-instruct-v0.2",
+    "mistralai/mistral-7b-instruct-v0.3",
+    "mistralai/mistral-large-3-675b-instruct-2512",
+    "mistralai/mistral-medium-3-instruct",
+    "mistralai/mistral-nemotron",
+    "mistralai/mistral-small-24b-instruct",
+    "mistralai/mistral-small-3.1-24b-instruct-2503",
+    "mistralai/mixtral-8x7b-instruct-v0.1",
+    "mistralai/mixtral-8x22b-instruct-v0.1",
+    # --- Google ---
+    "google/gemma-2-2b-it",
+    "google/gemma-2-9b-it",
+    "google/gemma-2-27b-it",
+    "google/gemma-3-1b-it",
+    "google/gemma-3-4b-it",
+    "google/gemma-3-12b-it",
+    "google/gemma-3-27b-it",
+    "google/gemma-3n-e2b-it",
+    "google/gemma-3n-e4b-it",
+    "google/gemma-7b",
+    "google/shieldgemma-9b",
+    # --- NVIDIA ---
+    "nvidia/llama-3.1-nemoguard-8b-content-safety",
+    "nvidia/llama-3.1-nemoguard-8b-topic-control",
+    "nvidia/llama-3.1-nemotron-70b-reward",
+    "nvidia/llama-3.1-nemotron-nano-8b-v1",
+    "nvidia/llama-3.1-nemotron-nano-vl-8b-v1",
+    "nvidia/llama-3.1-nemotron-safety-guard-8b-v3",
+    "nvidia/llama-3.3-nemotron-super-49b-v1",
+    "nvidia/llama-3.3-nemotron-super-49b-v1.5",
+    "nvidia/llama3-chatqa-1.5-8b",
+    "nvidia/nemotron-3-nano-30b-a3b",
+    "nvidia/nemotron-4-mini-hindi-4b-instruct",
+    "nvidia/nemotron-content-safety-reasoning-4b",
+    "nvidia/nemotron-mini-4b-instruct",
+    "nvidia/nvidia-nemotron-nano-9b-v2",
+    "nvidia/riva-translate-4b-instruct-v1.1",
+    "nvidia/usdcode-llama-3.1-70b-instruct",
+    # --- Deepseek ---
+    "deepseek-ai/deepseek-r1-distill-llama-8b",
+    "deepseek-ai/deepseek-r1-distill-qwen-32b",
+    "deepseek-ai/deepseek-v3.1-terminus",
+    "deepseek-ai/deepseek-v3.2",
+    # --- Qwen ---
+    "qwen/qwen2-7b-instruct",
+    "qwen/qwen2.5-7b-instruct",
+    "qwen/qwen2.5-coder-32b-instruct",
+    "qwen/qwen2.5-coder-7b-instruct",
+    "qwen/qwen3-235b-a22b",
+    "qwen/qwen3-coder-480b-a35b-instruct",
+    "qwen/qwen3-next-80b-a3b-instruct",
+    "qwen/qwen3-next-80b-a3b-thinking",
+    "qwen/qwq-32b",
+    # --- Microsoft ---
+    "microsoft/phi-3-medium-128k-instruct",
+    "microsoft/phi-3-medium-4k-instruct",
+    "microsoft/phi-3-mini-128k-instruct",
+    "microsoft/phi-3-mini-4k-instruct",
+    "microsoft/phi-3-small-128k-instruct",
+    "microsoft/phi-3-small-8k-instruct",
+    "microsoft/phi-3.5-mini-instruct",
+    "microsoft/phi-3.5-vision-instruct",
+    "microsoft/phi-4-mini-flash-reasoning",
+    "microsoft/phi-4-mini-instruct",
+    "microsoft/phi-4-multimodal-instruct",
+    # --- Moonshot ---
+    "moonshotai/kimi-k2-instruct",
+    "moonshotai/kimi-k2-instruct-0905",
+    "moonshotai/kimi-k2-thinking",
+    # --- OpenAI (open-source) ---
+    "openai/gpt-oss-20b",
+    "openai/gpt-oss-120b",
+    # --- AI21 Labs ---
+    "ai21labs/jamba-1.5-mini-instruct",
+    # --- Abacus AI ---
+    "abacusai/dracarys-llama-3.1-70b-instruct",
+    # --- IBM ---
+    "ibm/granite-guardian-3.0-8b",
+    # --- Stepfun ---
+    "stepfun-ai/step-3.5-flash",
+    # --- Z-AI (Zhipu) ---
+    "z-ai/glm5",
+    # --- ByteDance ---
+    "bytedance/seed-oss-36b-instruct",
+    # --- Tiiuae ---
+    "tiiuae/falcon3-7b-instruct",
+    # --- Upstage ---
+    "upstage/solar-10.7b-instruct",
+    # --- Baichuan ---
+    "baichuan-inc/baichuan2-13b-chat",
+    # --- THU ---
+    "thudm/chatglm3-6b",
+    # --- Sarvamai ---
+    "sarvamai/sarvam-m",
+    # --- Rakuten ---
+    "rakuten/rakutenai-7b-chat",
+    "rakuten/rakutenai-7b-instruct",
+    # --- Igenius ---
+    "igenius/italia_10b_instruct_16k",
+    # --- Stockmark ---
+    "stockmark/stockmark-2-100b-instruct",
+    # --- Speakleash ---
+    "speakleash/bielik-11b-v2.3-instruct",
+    "speakleash/bielik-11b-v2.6-instruct",
+    # --- Other ---
+    "gotocompany/gemma-2-9b-cpt-sahabatai-instruct",
+    "institute-of-science-tokyo/llama-3.1-swallow-70b-instruct-v0.1",
+    "institute-of-science-tokyo/llama-3.1-swallow-8b-instruct-v0.1",
+    "marin/marin-8b-instruct",
+    "mediatek/breeze-7b-instruct",
+    "opengpt-x/teuken-7b-instruct-commercial-v0.4",
+    "tokyotech-llm/llama-3-swallow-70b-instruct-v0.1",
+    "utter-project/eurollm-9b-instruct",
+    "yentinglin/llama-3-taiwan-70b-instruct",
+)
+MODEL_ID_INDEX = {m: i for i, m in enumerate(MODEL_IDS)}
+_MODEL_IDS_LOWER = tuple(m.lower() for m in MODEL_IDS)
+
+
+def _read_stored_keys() -> tuple[Optional[str], Optional[str]]:
+    """Read the NVIDIA and Google API keys from the OS keyring (blocking)."""
+    from src.utils.secure_storage import SecureStorage
+
+    return SecureStorage.get_api_key(), SecureStorage.get_google_api_key()
+
+
+def _has_running_loop() -> bool:
+    """Whether an asyncio loop is driving the Qt event loop (e.g. qasync)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# Client close() tasks, referenced until done so the loop can't drop them
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def _close_client_later(client) -> None:
+    """Close a cached API client in the background, logging any failure."""
+    if not _has_running_loop():
+        logger.warning("Cannot close API client: no running event loop")
+        return
+
+    def _on_closed(task: asyncio.Task):
+        _closing_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to close API client: {task.exception()}")
+
+    task = asyncio.get_running_loop().create_task(client.close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_on_closed)
+
+
+@contextlib.contextmanager
+def _signals_blocked(*widgets: QWidget):
+    """Silence widgets' signals while they are filled programmatically."""
+    for w in widgets:
+        w.blockSignals(True)
+    try:
+        yield
+    finally:
+        for w in widgets:
+            w.blockSignals(False)
+
+
+def _enumerate_monitors() -> list[tuple[str, int]]:
+    """List (name, index) for each monitor (blocking; initialises mss)."""
+    try:
+        from src.capabilities.screen_capture import ScreenCaptureService
+
+        return [
+            (mon["name"], mon["index"])
+            for mon in ScreenCaptureService().available_monitors()
+        ]
+    except Exception:
+        return [("Primary", 0)]
+
+
+def _capture_test_frame(monitor: int) -> Optional[bytes]:
+    """Grab one JPEG frame from a monitor (blocking; mss grab + encode)."""
+    from src.capabilities.screen_capture import ScreenCaptureService
+
+    service = ScreenCaptureService(monitor=monitor)
+    # Temporarily allow capture for test (bypass background check)
+    service._app_in_background = True
+    return service.capture_once()
+
+
+@functools.cache
+def _nvidia_client_cls():
+    """Import NVIDIAClient on first use only (pulls in httpx)."""
+    from src.api.nvidia_client import NVIDIAClient
+
+    return NVIDIAClient
+
+
+class _ModelFilterProxy(QSortFilterProxyModel):
+    """Case-insensitive substring filter over MODEL_IDS.
+
+    Matches against a prebuilt lowercase index instead of Qt's per-item
+    case-folded comparison.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pattern = ""
+
+    def set_pattern(self, text: str):
+        """Set the filter text and re-run the filter."""
+        self._pattern = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        return self._pattern in _MODEL_IDS_LOWER[source_row]
 
 
 class SettingsDialog(QDialog):
@@ -34,13 +302,39 @@ class SettingsDialog(QDialog):
 
     settings_changed = pyqtSignal()
 
-    def __init__(self, orchestrator: AgentOrchestrator, parent=None):
+    _API_TAB, _MODEL_TAB, _SCREEN_TAB, _MEMORY_TAB = range(4)
+
+    # Seconds to wait for the NVIDIA health check before giving up
+    _TEST_TIMEOUT = 10.0
+
+    _shared_model: Optional[QStringListModel] = None
+    _shared_proxy: Optional[_ModelFilterProxy] = None
+    _shared_completer: Optional[QCompleter] = None
+
+    # Show/Hide button state -> (echo mode, button label)
+    _ECHO = {
+        True: (QLineEdit.EchoMode.Normal, "Hide"),
+        False: (QLineEdit.EchoMode.Password, "Show"),
+    }
+
+    def __init__(self, orchestrator: "AgentOrchestrator", parent=None):
         super().__init__(parent)
         self.orchestrator = orchestrator
+        # Start the keyring read now so it overlaps widget construction
+        self._keyring_future = self._start_keyring_read()
+        self._keyring_task: Optional[asyncio.Task] = None
+        self._test_task: Optional[asyncio.Task] = None
+        self._clear_task: Optional[asyncio.Task] = None
+        self._monitors_task: Optional[asyncio.Task] = None
+        self._monitors_detected = False
+        self._capture_task: Optional[asyncio.Task] = None
+        self._client_cache: Optional[tuple] = None  # ((api_key, base_url), client)
         self.setWindowTitle("Settings")
         self.setMinimumSize(600, 500)
         self._setup_ui()
-        self._load_settings()
+        # Tab contents are built on the next event-loop tick so the dialog
+        # chrome paints first
+        QTimer.singleShot(0, lambda: self._ensure_tab_built(self._API_TAB))
 
     def _setup_ui(self):
         """Setup dialog UI."""
@@ -52,23 +346,17 @@ class SettingsDialog(QDialog):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
 
-        # API tab
-        self.api_tab = self._create_api_tab()
-        self.tabs.addTab(self.api_tab, "API")
-        # Hide Ollama fields initially (must happen after self.api_tab is set)
-        self._toggle_ollama_fields(False)
-
-        # Model tab
-        self.model_tab = self._create_model_tab()
-        self.tabs.addTab(self.model_tab, "Model")
-
-        # Screen tab
-        self.screen_tab = self._create_screen_tab()
-        self.tabs.addTab(self.screen_tab, "Screen")
-
-        # Memory tab
-        self.memory_tab = self._create_memory_tab()
-        self.tabs.addTab(self.memory_tab, "Memory")
+        # Every tab starts as a placeholder and is built (and loaded) the
+        # first time it is shown
+        self._lazy_tabs = {
+            self._API_TAB: ("API", self._create_api_tab, self._load_settings),
+            self._MODEL_TAB: ("Model", self._create_model_tab, self._load_model_settings),
+            self._SCREEN_TAB: ("Screen", self._create_screen_tab, self._load_screen_settings),
+            self._MEMORY_TAB: ("Memory", self._create_memory_tab, self._load_memory_settings),
+        }
+        for index in sorted(self._lazy_tabs):
+            self.tabs.addTab(QWidget(), self._lazy_tabs[index][0])
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         # Button box
         self.button_box = QDialogButtonBox(
@@ -83,9 +371,69 @@ class SettingsDialog(QDialog):
         )
         layout.addWidget(self.button_box)
 
+        # (name, tab, getter, setter) for fields only written when changed
+        self._field_specs = [
+            (
+                "base_url", self._API_TAB,
+                lambda: self.base_url_input.text().strip(), self._save_base_url,
+            ),
+            (
+                "api_key", self._API_TAB,
+                lambda: self.api_key_input.text().strip(), self._save_api_key,
+            ),
+            (
+                "google_api_key", self._API_TAB,
+                lambda: self.google_api_key_input.text().strip(), self._save_google_api_key,
+            ),
+            (
+                "model", self._MODEL_TAB,
+                lambda: self.model_combo.currentText().strip(), self._save_model,
+            ),
+        ]
+        self._initial: dict[str, str] = {}
+
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.settings_changed)
+
+        # Reverts the "Settings applied" confirmation; any newer status wins
+        self._status_revert: tuple[str, str] = ("", "")
+        self._status_revert_timer = QTimer(self)
+        self._status_revert_timer.setSingleShot(True)
+        self._status_revert_timer.setInterval(2000)
+        self._status_revert_timer.timeout.connect(
+            lambda: self._set_status(*self._status_revert)
+        )
+
+    def _is_tab_built(self, index: int) -> bool:
+        """Check whether a tab's widgets exist yet."""
+        return index not in self._lazy_tabs
+
+    def _ensure_tab_built(self, index: int):
+        """Build and load a lazily created tab the first time it is shown."""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return
+        title, builder, loader = entry
+        placeholder = self.tabs.widget(index)
+        current = self.tabs.currentIndex()
+        # One layout/paint pass for the whole tab instead of one per widget
+        self.setUpdatesEnabled(False)
+        try:
+            with _signals_blocked(self.tabs):
+                self.tabs.removeTab(index)
+                self.tabs.insertTab(index, builder(), title)
+                self.tabs.setCurrentIndex(current)
+            placeholder.deleteLater()
+            loader()
+        finally:
+            self.setUpdatesEnabled(True)
+
     def _create_api_tab(self) -> QWidget:
         """Create API settings tab."""
         widget = QWidget()
+        self.api_tab = widget
         layout = QFormLayout(widget)
         layout.setSpacing(12)
 
@@ -117,7 +465,8 @@ class SettingsDialog(QDialog):
 
         # Status label
         self.status_label = QLabel("Not configured")
-        self.status_label.setStyleSheet("color: #FF4500;")
+        self.status_label.setStyleSheet(_STATUS_QSS)
+        self.status_label.setProperty("state", "err")
         layout.addRow("Status:", self.status_label)
 
         # --- Separator ---
@@ -180,7 +529,9 @@ class SettingsDialog(QDialog):
         layout.addRow("", self.ollama_test_btn)
 
         self.ollama_status_label = QLabel("Not configured")
-        self.ollama_status_label.setStyleSheet("color: #888; padding: 2px 0;")
+        self.ollama_status_label.setStyleSheet(
+            "QLabel { color: #888; padding: 2px 0; }" + _STATUS_QSS
+        )
         layout.addRow("Ollama Status:", self.ollama_status_label)
 
         ollama_note = QLabel(
@@ -199,8 +550,7 @@ class SettingsDialog(QDialog):
             self.ollama_url_input, self.ollama_model_input,
             self.ollama_test_btn, self.ollama_status_label, ollama_note,
         ]
-        # NOTE: _toggle_ollama_fields is called from _setup_ui AFTER
-        #       self.api_tab is assigned, to avoid AttributeError.
+        self._toggle_ollama_fields(False)
 
         return widget
 
@@ -213,153 +563,31 @@ class SettingsDialog(QDialog):
         # Model selection
         self.model_combo = QComboBox()
         self.model_combo.setEditable(True)
-        self.model_combo.addItems([
-            # --- Meta Llama ---
-            "meta/llama-3.1-8b-instruct",
-            "meta/llama-3.1-70b-instruct",
-            "meta/llama-3.2-1b-instruct",
-            "meta/llama-3.2-3b-instruct",
-            "meta/llama-3.2-11b-vision-instruct",
-            "meta/llama-3.2-90b-vision-instruct",
-            "meta/llama-3.3-70b-instruct",
-            "meta/llama-4-maverick-17b-128e-instruct",
-            "meta/llama-4-scout-17b-16e-instruct",
-            "meta/llama-guard-4-12b",
-            "meta/llama3-70b-instruct",
-            "meta/llama3-8b-instruct",
-            # --- Mistral ---
-            "mistralai/devstral-2-123b-instruct-2512",
-            "mistralai/magistral-small-2506",
-            "mistralai/mamba-codestral-7b-v0.1",
-            "mistralai/mathstral-7b-v0.1",
-            "mistralai/ministral-14b-instruct-2512",
-            "mistralai/mistral-7b-instruct-v0.2",
-            "mistralai/mistral-7b-instruct-v0.3",
-            "mistralai/mistral-large-3-675b-instruct-2512",
-            "mistralai/mistral-medium-3-instruct",
-            "mistralai/mistral-nemotron",
-            "mistralai/mistral-small-24b-instruct",
-            "mistralai/mistral-small-3.1-24b-instruct-2503",
-            "mistralai/mixtral-8x7b-instruct-v0.1",
-            "mistralai/mixtral-8x22b-instruct-v0.1",
-            # --- Google ---
-            "google/gemma-2-2b-it",
-            "google/gemma-2-9b-it",
-            "google/gemma-2-27b-it",
-            "google/gemma-3-1b-it",
-            "google/gemma-3-4b-it",
-            "google/gemma-3-12b-it",
-            "google/gemma-3-27b-it",
-            "google/gemma-3n-e2b-it",
-            "google/gemma-3n-e4b-it",
-            "google/gemma-7b",
-            "google/shieldgemma-9b",
-            # --- NVIDIA ---
-            "nvidia/llama-3.1-nemoguard-8b-content-safety",
-            "nvidia/llama-3.1-nemoguard-8b-topic-control",
-            "nvidia/llama-3.1-nemotron-70b-reward",
-            "nvidia/llama-3.1-nemotron-nano-8b-v1",
-            "nvidia/llama-3.1-nemotron-nano-vl-8b-v1",
-            "nvidia/llama-3.1-nemotron-safety-guard-8b-v3",
-            "nvidia/llama-3.3-nemotron-super-49b-v1",
-            "nvidia/llama-3.3-nemotron-super-49b-v1.5",
-            "nvidia/llama3-chatqa-1.5-8b",
-            "nvidia/nemotron-3-nano-30b-a3b",
-            "nvidia/nemotron-4-mini-hindi-4b-instruct",
-            "nvidia/nemotron-content-safety-reasoning-4b",
-            "nvidia/nemotron-mini-4b-instruct",
-            "nvidia/nvidia-nemotron-nano-9b-v2",
-            "nvidia/riva-translate-4b-instruct-v1.1",
-            "nvidia/usdcode-llama-3.1-70b-instruct",
-            # --- Deepseek ---
-            "deepseek-ai/deepseek-r1-distill-llama-8b",
-            "deepseek-ai/deepseek-r1-distill-qwen-32b",
-            "deepseek-ai/deepseek-v3.1-terminus",
-            "deepseek-ai/deepseek-v3.2",
-            # --- Qwen ---
-            "qwen/qwen2-7b-instruct",
-            "qwen/qwen2.5-7b-instruct",
-            "qwen/qwen2.5-coder-32b-instruct",
-            "qwen/qwen2.5-coder-7b-instruct",
-            "qwen/qwen3-235b-a22b",
-            "qwen/qwen3-coder-480b-a35b-instruct",
-            "qwen/qwen3-next-80b-a3b-instruct",
-            "qwen/qwen3-next-80b-a3b-thinking",
-            "qwen/qwq-32b",
-            # --- Microsoft ---
-            "microsoft/phi-3-medium-128k-instruct",
-            "microsoft/phi-3-medium-4k-instruct",
-            "microsoft/phi-3-mini-128k-instruct",
-            "microsoft/phi-3-mini-4k-instruct",
-            "microsoft/phi-3-small-128k-instruct",
-            "microsoft/phi-3-small-8k-instruct",
-            "microsoft/phi-3.5-mini-instruct",
-            "microsoft/phi-3.5-vision-instruct",
-            "microsoft/phi-4-mini-flash-reasoning",
-            "microsoft/phi-4-mini-instruct",
-            "microsoft/phi-4-multimodal-instruct",
-            # --- Moonshot ---
-            "moonshotai/kimi-k2-instruct",
-            "moonshotai/kimi-k2-instruct-0905",
-            "moonshotai/kimi-k2-thinking",
-            # --- OpenAI (open-source) ---
-            "openai/gpt-oss-20b",
-            "openai/gpt-oss-120b",
-            # --- AI21 Labs ---
-            "ai21labs/jamba-1.5-mini-instruct",
-            # --- Abacus AI ---
-            "abacusai/dracarys-llama-3.1-70b-instruct",
-            # --- IBM ---
-            "ibm/granite-guardian-3.0-8b",
-            # --- Stepfun ---
-            "stepfun-ai/step-3.5-flash",
-            # --- Z-AI (Zhipu) ---
-            "z-ai/glm5",
-            # --- ByteDance ---
-            "bytedance/seed-oss-36b-instruct",
-            # --- Tiiuae ---
-            "tiiuae/falcon3-7b-instruct",
-            # --- Upstage ---
-            "upstage/solar-10.7b-instruct",
-            # --- Baichuan ---
-            "baichuan-inc/baichuan2-13b-chat",
-            # --- THU ---
-            "thudm/chatglm3-6b",
-            # --- Sarvamai ---
-            "sarvamai/sarvam-m",
-            # --- Rakuten ---
-            "rakuten/rakutenai-7b-chat",
-            "rakuten/rakutenai-7b-instruct",
-            # --- Igenius ---
-            "igenius/italia_10b_instruct_16k",
-            # --- Stockmark ---
-            "stockmark/stockmark-2-100b-instruct",
-            # --- Speakleash ---
-            "speakleash/bielik-11b-v2.3-instruct",
-            "speakleash/bielik-11b-v2.6-instruct",
-            # --- Other ---
-            "gotocompany/gemma-2-9b-cpt-sahabatai-instruct",
-            "institute-of-science-tokyo/llama-3.1-swallow-70b-instruct-v0.1",
-            "institute-of-science-tokyo/llama-3.1-swallow-8b-instruct-v0.1",
-            "marin/marin-8b-instruct",
-            "mediatek/breeze-7b-instruct",
-            "opengpt-x/teuken-7b-instruct-commercial-v0.4",
-            "tokyotech-llm/llama-3-swallow-70b-instruct-v0.1",
-            "utter-project/eurollm-9b-instruct",
-            "yentinglin/llama-3-taiwan-70b-instruct",
-        ])
+        # The list model is built once per process and shared by every dialog
+        # instance; custom entries are never inserted so it stays untouched.
+        if SettingsDialog._shared_model is None:
+            SettingsDialog._shared_model = QStringListModel(
+                list(MODEL_IDS), QCoreApplication.instance()
+            )
+        self.model_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        with _signals_blocked(self.model_combo):
+            self.model_combo.setModel(SettingsDialog._shared_model)
         self.model_combo.setMaxVisibleItems(20)
         self.model_combo.setMaxCount(200)
 
-        # Add search/filter completer for easy model lookup
-        from PyQt6.QtCore import Qt as QtCore_Qt
-        from PyQt6.QtWidgets import QCompleter
-        completer = QCompleter([
-            self.model_combo.itemText(i) for i in range(self.model_combo.count())
-        ])
-        completer.setCaseSensitivity(QtCore_Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(QtCore_Qt.MatchFlag.MatchContains)
-        self.model_combo.setCompleter(completer)
+        # Add search/filter completer for easy model lookup. It is attached on
+        # first focus (most users just pick from the list) and driven manually
+        # so bursts of typing collapse into a single filter pass.
+        self.model_combo.setCompleter(None)
+        # On the combo, not its line edit: the combo is the editor's focus
+        # proxy and forwards focus to it without going through event filters
+        self.model_combo.installEventFilter(self)
+        self._pending_model_text = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(75)
+        self._filter_timer.timeout.connect(self._apply_model_filter)
+        self.model_combo.lineEdit().textEdited.connect(self._on_model_text_edited)
 
         layout.addRow("Model:", self.model_combo)
 
@@ -379,6 +607,44 @@ class SettingsDialog(QDialog):
 
         return widget
 
+    def eventFilter(self, obj, event) -> bool:
+        """Attach the model completer the first time the model editor gets focus."""
+        if event.type() == QEvent.Type.FocusIn:
+            obj.removeEventFilter(self)
+            self._attach_model_completer(self.model_combo.lineEdit())
+        return super().eventFilter(obj, event)
+
+    @classmethod
+    def _attach_model_completer(cls, editor: QLineEdit):
+        """Point the shared completer at an editor, building it on first use."""
+        if cls._shared_completer is None:
+            app = QCoreApplication.instance()
+            proxy = _ModelFilterProxy(app)
+            proxy.setSourceModel(cls._shared_model)
+            cls._shared_proxy = proxy
+            # The proxy does the filtering, so the completer shows it as-is
+            completer = QCompleter(proxy, app)
+            completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+            completer.activated.connect(lambda text: completer.widget().setText(text))
+            cls._shared_completer = completer
+        cls._shared_completer.setWidget(editor)
+
+    def _on_model_text_edited(self, text: str):
+        """Restart the completer debounce timer on each keystroke."""
+        self._pending_model_text = text
+        self._filter_timer.start()
+
+    def _apply_model_filter(self):
+        """Filter the model completer once typing has settled."""
+        editor = self.model_combo.lineEdit()
+        completer = SettingsDialog._shared_completer
+        if completer is None or completer.widget() is not editor:
+            # Typing can arrive without a FocusIn having attached it first
+            self._attach_model_completer(editor)
+        SettingsDialog._shared_proxy.set_pattern(self._pending_model_text)
+        if self._pending_model_text:
+            SettingsDialog._shared_completer.complete()
+
     def _create_screen_tab(self) -> QWidget:
         """Create screen access settings tab."""
         widget = QWidget()
@@ -397,15 +663,23 @@ class SettingsDialog(QDialog):
         self.screen_gemini_check.setChecked(False)
         access_layout.addWidget(self.screen_gemini_check)
 
+        # The monitor list is only needed once capture is (being) enabled
+        for check in (self.screen_vision_check, self.screen_gemini_check):
+            check.toggled.connect(self._on_screen_access_toggled)
+
         layout.addWidget(access_group)
 
         # Capture Settings group
         capture_group = QGroupBox("Capture Settings")
         capture_layout = QFormLayout(capture_group)
 
-        # Monitor selection
+        # Monitor selection: holds just the saved monitor until detection runs,
+        # so saving before then does not reset it
+        saved_monitor = self.orchestrator.config.screen_capture_monitor
         self.monitor_combo = QComboBox()
-        self._populate_monitors()
+        self.monitor_combo.addItem(
+            "Primary" if saved_monitor == 0 else f"Monitor {saved_monitor + 1}", saved_monitor
+        )
         capture_layout.addRow("Monitor:", self.monitor_combo)
 
         # Capture interval
@@ -437,14 +711,14 @@ class SettingsDialog(QDialog):
         layout.addWidget(info_btn)
 
         # Test button
-        test_btn = QPushButton("Test screen capture")
-        test_btn.setStyleSheet(
+        self.screen_test_btn = QPushButton("Test screen capture")
+        self.screen_test_btn.setStyleSheet(
             "QPushButton { background-color: #1e1a14; color: #FF8C42; "
             "border: 1px solid #2a2218; padding: 6px; }"
             "QPushButton:hover { border-color: #FF8C42; background-color: #2a2218; }"
         )
-        test_btn.clicked.connect(self._test_screen_capture)
-        layout.addWidget(test_btn)
+        self.screen_test_btn.clicked.connect(self._test_screen_capture)
+        layout.addWidget(self.screen_test_btn)
 
         # OCR info
         ocr_note = QLabel(
@@ -459,18 +733,42 @@ class SettingsDialog(QDialog):
 
         return widget
 
-    def _populate_monitors(self):
-        """Populate monitor dropdown from available screens."""
-        self.monitor_combo.clear()
+    def _on_screen_access_toggled(self, checked: bool):
+        """Detect monitors the first time a screen capture option is enabled."""
+        if checked:
+            self._ensure_monitors()
+
+    def _ensure_monitors(self):
+        """Start monitor detection unless it already ran."""
+        if self._monitors_detected:
+            return
+        self._monitors_detected = True
+        if not _has_running_loop():
+            # No asyncio loop behind Qt: enumerate synchronously instead
+            self._fill_monitor_combo(_enumerate_monitors())
+            return
+        self.monitor_combo.setItemText(0, "Detecting...")
+        self.monitor_combo.setEnabled(False)
+        self._monitors_task = self._spawn(self._populate_monitors(), "detect monitors")
+
+    async def _populate_monitors(self):
+        """Populate monitor dropdown from screens enumerated in a worker thread."""
         try:
-            from src.capabilities.screen_capture import ScreenCaptureService
+            monitors = await asyncio.get_running_loop().run_in_executor(
+                None, _enumerate_monitors
+            )
+            self._fill_monitor_combo(monitors)
+        finally:
+            self.monitor_combo.setEnabled(True)
 
-            service = ScreenCaptureService()
-            monitors = service.available_monitors()
-            for mon in monitors:
-                self.monitor_combo.addItem(mon["name"], mon["index"])
-        except Exception:
-            self.monitor_combo.addItem("Primary", 0)
+    def _fill_monitor_combo(self, monitors: list[tuple[str, int]]):
+        """Replace the monitor dropdown entries, keeping the selection."""
+        selected = self.monitor_combo.currentData()
+        with _signals_blocked(self.monitor_combo):
+            self.monitor_combo.clear()
+            for name, index in monitors:
+                self.monitor_combo.addItem(name, index)
+            self.monitor_combo.setCurrentIndex(max(self.monitor_combo.findData(selected), 0))
 
     def _show_screen_info(self):
         """Show info dialog explaining screen access behavior."""
@@ -492,15 +790,31 @@ class SettingsDialog(QDialog):
         )
 
     def _test_screen_capture(self):
-        """Take a test screenshot and show results (with optional OCR)."""
-        from src.capabilities.screen_capture import ScreenCaptureService
-
+        """Take a test screenshot in a worker thread and show the results."""
+        self._ensure_monitors()
         monitor_idx = self.monitor_combo.currentData() or 0
-        service = ScreenCaptureService(monitor=monitor_idx)
-        # Temporarily allow capture for test (bypass background check)
-        service._app_in_background = True
-        frame = service.capture_once()
+        if not _has_running_loop():
+            self._show_capture_result(_capture_test_frame(monitor_idx))
+            return
+        self.screen_test_btn.setEnabled(False)
+        self._capture_task = self._spawn(
+            self._do_test_screen_capture(monitor_idx), "test screen capture"
+        )
+        if self._capture_task is None:
+            self.screen_test_btn.setEnabled(True)
 
+    async def _do_test_screen_capture(self, monitor_idx: int):
+        """Show results of a test screenshot (with optional OCR)."""
+        try:
+            frame = await asyncio.get_running_loop().run_in_executor(
+                None, _capture_test_frame, monitor_idx
+            )
+        finally:
+            self.screen_test_btn.setEnabled(True)
+        self._show_capture_result(frame)
+
+    def _show_capture_result(self, frame: Optional[bytes]):
+        """Report a test screenshot (with optional OCR hint)."""
         if frame is None:
             QMessageBox.warning(
                 self,
@@ -575,71 +889,150 @@ class SettingsDialog(QDialog):
         return widget
 
     def _load_settings(self):
-        """Load current settings."""
+        """Load current settings into the API tab.
+
+        The other tabs load their own fields when first built.
+        """
         config = self.orchestrator.config
+        fields = (
+            self.api_key_input, self.google_api_key_input, self.base_url_input,
+            self.ollama_enabled_check, self.ollama_url_input, self.ollama_model_input,
+        )
+        with _signals_blocked(*fields):
+            # Load API keys: .env values show immediately, keyring values
+            # (preferred) are read off the GUI thread and replace them on arrival
+            if config.nvidia_api_key and config.nvidia_api_key != "your_api_key_here":
+                self.api_key_input.setText(config.nvidia_api_key)
+                self._set_status("ok", "Configured (from .env)")
+            if config.google_api_key:
+                self.google_api_key_input.setText(config.google_api_key)
+            QTimer.singleShot(0, self._load_api_keys_async)
+
+            # Base URL
+            self.base_url_input.setText(config.nvidia_base_url)
+
+            # Ollama (toggled is blocked, so the fields are shown/hidden once)
+            self.ollama_enabled_check.setChecked(config.ollama_enabled)
+            self.ollama_url_input.setText(config.ollama_base_url)
+            self.ollama_model_input.setText(config.ollama_model)
+        self._toggle_ollama_fields(config.ollama_enabled)
+
+        self._snapshot_fields(self._API_TAB)
 
-        # Load API key: prefer keyring, fall back to .env
-        stored_key = SecureStorage.get_api_key()
-        if stored_key:
+    def _load_model_settings(self):
+        """Load model tab settings."""
+        config = self.orchestrator.config
+        model_index = MODEL_ID_INDEX.get(config.default_model, -1)
+        with _signals_blocked(self.model_combo):
+            if model_index >= 0:
+                self.model_combo.setCurrentIndex(model_index)
+            else:
+                self.model_combo.setCurrentText(config.default_model)
+        self._snapshot_fields(self._MODEL_TAB)
+
+    def _load_screen_settings(self):
+        """Load screen tab settings."""
+        config = self.orchestrator.config
+        with _signals_blocked(
+            self.screen_vision_check, self.screen_gemini_check,
+            self.monitor_combo, self.capture_interval_spin,
+        ):
+            self.screen_vision_check.setChecked(config.screen_capture_vision)
+            self.screen_gemini_check.setChecked(config.screen_capture_gemini)
+            monitor_index = self.monitor_combo.findData(config.screen_capture_monitor)
+            if monitor_index >= 0:
+                self.monitor_combo.setCurrentIndex(monitor_index)
+            self.capture_interval_spin.setValue(config.screen_capture_interval)
+        if config.screen_capture_vision or config.screen_capture_gemini:
+            self._ensure_monitors()
+
+    def _load_memory_settings(self):
+        """Load memory tab settings."""
+        self.db_path_input.setText(str(self.orchestrator.config.db_path))
+
+    def _snapshot_fields(self, tab: int):
+        """Remember the loaded values of a tab's change-tracked fields."""
+        for name, spec_tab, getter, _ in self._field_specs:
+            if spec_tab == tab:
+                self._initial[name] = getter()
+
+    @staticmethod
+    def _start_keyring_read() -> Optional[asyncio.Future]:
+        """Read the keyring in a worker thread; None when no loop is running."""
+        if not _has_running_loop():
+            return None
+        return asyncio.get_running_loop().run_in_executor(None, _read_stored_keys)
+
+    def _load_api_keys_async(self):
+        """Apply the stored API keys once the dialog is on screen."""
+        if self._keyring_future is None:
+            # No asyncio loop behind Qt: read synchronously instead
+            self._apply_stored_keys(*_read_stored_keys())
+            return
+        self._keyring_task = self._spawn(self._load_api_keys_task(), "load API keys")
+
+    async def _load_api_keys_task(self):
+        """Apply the API keys read from the OS keyring in a worker thread."""
+        self._apply_stored_keys(*await self._keyring_future)
+
+    def _apply_stored_keys(self, stored_key: Optional[str], stored_google_key: Optional[str]):
+        """Fill the key fields from secure storage."""
+        # Never clobber a key the user started typing in the meantime
+        if stored_key and not self.api_key_input.isModified():
             self.api_key_input.setText(stored_key)
-            self.status_label.setText("Configured (from secure storage)")
-            self.status_label.setStyleSheet("color: #FF8C42;")
-        elif config.nvidia_api_key and config.nvidia_api_key != "your_api_key_here":
-            self.api_key_input.setText(config.nvidia_api_key)
-            self.status_label.setText("Configured (from .env)")
-            self.status_label.setStyleSheet("color: #FF8C42;")
-
-        # Load Google API key: prefer keyring, fall back to .env
-        stored_google_key = SecureStorage.get_google_api_key()
-        if stored_google_key:
+            self._initial["api_key"] = stored_key
+            self._set_status("ok", "Configured (from secure storage)")
+        if stored_google_key and not self.google_api_key_input.isModified():
             self.google_api_key_input.setText(stored_google_key)
-        elif config.google_api_key:
-            self.google_api_key_input.setText(config.google_api_key)
+            self._initial["google_api_key"] = stored_google_key
 
-        # Base URL
-        self.base_url_input.setText(config.nvidia_base_url)
-
-        # Screen capture settings
-        self.screen_vision_check.setChecked(config.screen_capture_vision)
-        self.screen_gemini_check.setChecked(config.screen_capture_gemini)
-        monitor_index = self.monitor_combo.findData(config.screen_capture_monitor)
-        if monitor_index >= 0:
-            self.monitor_combo.setCurrentIndex(monitor_index)
-        self.capture_interval_spin.setValue(config.screen_capture_interval)
-
-        # Database path
-        self.db_path_input.setText(str(config.db_path))
-
-        # Model
-        model_index = self.model_combo.findText(config.default_model)
-        if model_index >= 0:
-            self.model_combo.setCurrentIndex(model_index)
-        else:
-            self.model_combo.setCurrentText(config.default_model)
+    def _spawn(self, coro, what: str) -> Optional[asyncio.Task]:
+        """Schedule a coroutine on the running asyncio loop.
 
-        # Ollama
-        self.ollama_enabled_check.setChecked(config.ollama_enabled)
-        self.ollama_url_input.setText(config.ollama_base_url)
-        self.ollama_model_input.setText(config.ollama_model)
-        self._toggle_ollama_fields(config.ollama_enabled)
+        Returns None (and tells the user) instead of raising when no loop is
+        driving the Qt event loop; failures are logged rather than lost with
+        the task.
+        """
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()
+            logger.error(f"Cannot {what}: no running event loop")
+            QMessageBox.critical(self, "Error", f"Cannot {what}: event loop is not running")
+            return None
+
+        def _log_failure(t: asyncio.Task):
+            if not t.cancelled() and t.exception() is not None:
+                logger.error(f"Failed to {what}: {t.exception()}")
+
+        task.add_done_callback(_log_failure)
+        return task
+
+    def _set_status(self, state: str, text: str, label: Optional[QLabel] = None):
+        """Set a status label's text and colour state (ok/err/busy/online)."""
+        if label is None or label is getattr(self, "status_label", None):
+            label = self.status_label
+            self._status_revert_timer.stop()
+        label.setText(text)
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def _set_key_visibility(self, field: QLineEdit, button: QPushButton, visible: bool):
+        """Switch a key field's echo mode, skipping the Qt work if unchanged."""
+        mode, text = self._ECHO[visible]
+        if field.echoMode() != mode:
+            field.setEchoMode(mode)
+            button.setText(text)
 
     def _toggle_api_key_visibility(self, checked: bool):
         """Toggle API key visibility."""
-        if checked:
-            self.api_key_input.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.show_key_btn.setText("Hide")
-        else:
-            self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
-            self.show_key_btn.setText("Show")
+        self._set_key_visibility(self.api_key_input, self.show_key_btn, checked)
 
     def _toggle_google_key_visibility(self, checked: bool):
         """Toggle Google API key visibility."""
-        if checked:
-            self.google_api_key_input.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.show_google_key_btn.setText("Hide")
-        else:
-            self.google_api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
-            self.show_google_key_btn.setText("Show")
+        self._set_key_visibility(self.google_api_key_input, self.show_google_key_btn, checked)
 
     def _toggle_ollama_fields(self, enabled: bool):
         """Show/hide Ollama configuration fields."""
@@ -662,9 +1055,10 @@ class SettingsDialog(QDialog):
         url = self.ollama_url_input.text().strip() or "http://localhost:11434/v1"
         self.ollama_test_btn.setEnabled(False)
         self.ollama_test_btn.setText("Testing...")
-        self.ollama_status_label.setText("Testing...")
-        self.ollama_status_label.setStyleSheet("color: #FFA500;")
-        asyncio.create_task(self._do_test_ollama(url))
+        self._set_status("busy", "Testing...", self.ollama_status_label)
+        if self._spawn(self._do_test_ollama(url), "test Ollama connection") is None:
+            self.ollama_test_btn.setEnabled(True)
+            self.ollama_test_btn.setText("Test Ollama Connection")
 
     async def _do_test_ollama(self, url: str):
         """Perform Ollama connection test."""
@@ -676,8 +1070,9 @@ class SettingsDialog(QDialog):
                     data = resp.json()
                     models = [m.get('id', m.get('name', '?')) for m in data.get('models', data.get('data', []))]
                     count = len(models)
-                    self.ollama_status_label.setText(f"Connected ({count} models)")
-                    self.ollama_status_label.setStyleSheet("color: #4CAF50;")
+                    self._set_status(
+                        "online", f"Connected ({count} models)", self.ollama_status_label
+                    )
                     model_list = ', '.join(models[:8])
                     if count > 8:
                         model_list += f' ... +{count - 8} more'
@@ -686,11 +1081,9 @@ class SettingsDialog(QDialog):
                         f"Ollama is running!\n\nModels: {model_list}"
                     )
                 else:
-                    self.ollama_status_label.setText(f"HTTP {resp.status_code}")
-                    self.ollama_status_label.setStyleSheet("color: #FF4500;")
+                    self._set_status("err", f"HTTP {resp.status_code}", self.ollama_status_label)
         except _httpx.ConnectError:
-            self.ollama_status_label.setText("Connection failed")
-            self.ollama_status_label.setStyleSheet("color: #FF4500;")
+            self._set_status("err", "Connection failed", self.ollama_status_label)
             QMessageBox.warning(
                 self, "Ollama Not Found",
                 "Could not connect to Ollama.\n\n"
@@ -699,8 +1092,7 @@ class SettingsDialog(QDialog):
                 f"URL tried: {url}"
             )
         except Exception as e:
-            self.ollama_status_label.setText(f"Error: {str(e)[:40]}")
-            self.ollama_status_label.setStyleSheet("color: #FF4500;")
+            self._set_status("err", f"Error: {str(e)[:40]}", self.ollama_status_label)
         finally:
             self.ollama_test_btn.setEnabled(True)
             self.ollama_test_btn.setText("Test Ollama Connection")
@@ -722,28 +1114,43 @@ class SettingsDialog(QDialog):
 
         self.test_btn.setEnabled(False)
         self.test_btn.setText("Testing...")
-        self.status_label.setText("Testing...")
-        self.status_label.setStyleSheet("color: #FFA500;")
+        self._set_status("busy", "Testing...")
 
-        # Test asynchronously
-        asyncio.create_task(self._do_test_connection(api_key))
+        # Test asynchronously; keep the task so closing the dialog can cancel it
+        self._test_task = self._spawn(self._do_test_connection(api_key), "test connection")
+        if self._test_task is None:
+            self.test_btn.setEnabled(True)
+            self.test_btn.setText("Test Connection")
+
+    def _get_test_client(self, api_key: str, base_url: str):
+        """Return a client for the key/URL pair, reusing the last one if unchanged.
+
+        Keeps the HTTPS connection pool warm across repeated test clicks.
+        """
+        key = (api_key, base_url)
+        if self._client_cache is not None:
+            cached_key, client = self._client_cache
+            if cached_key == key:
+                return client
+            _close_client_later(client)
+        client = _nvidia_client_cls()(api_key=api_key, base_url=base_url)
+        self._client_cache = (key, client)
+        return client
 
     async def _do_test_connection(self, api_key: str):
         """Perform connection test using health check."""
-        from src.api.nvidia_client import NVIDIAClient
-
         base_url = self.base_url_input.text().strip() or "https://integrate.api.nvidia.com/v1"
-        client = NVIDIAClient(api_key=api_key, base_url=base_url)
         try:
-            health = await client.check_health()
+            # Inside the try so a failing constructor still restores the button
+            client = self._get_test_client(api_key, base_url)
+            health = await asyncio.wait_for(
+                client.check_health(), timeout=self._TEST_TIMEOUT
+            )
 
             if health["ok"]:
                 latency = health["latency_ms"]
                 models = health["model_count"]
-                self.status_label.setText(
-                    f"Connected ({latency:.0f}ms, {models} models)"
-                )
-                self.status_label.setStyleSheet("color: #FF8C42;")
+                self._set_status("ok", f"Connected ({latency:.0f}ms, {models} models)")
                 QMessageBox.information(
                     self,
                     "Success",
@@ -753,8 +1160,7 @@ class SettingsDialog(QDialog):
                 )
             else:
                 error = health.get("error", "Unknown error")
-                self.status_label.setText(f"Failed: {error[:40]}")
-                self.status_label.setStyleSheet("color: #FF4500;")
+                self._set_status("err", f"Failed: {error[:40]}")
                 QMessageBox.critical(
                     self,
                     "Connection Failed",
@@ -765,26 +1171,41 @@ class SettingsDialog(QDialog):
                     f"• The base URL is correct\n"
                     f"• You have internet connectivity",
                 )
+        except asyncio.CancelledError:
+            logger.debug("Connection test cancelled")
+            raise
+        except asyncio.TimeoutError:
+            self._set_status("err", "Error: timed out")
+            QMessageBox.critical(
+                self, "Error",
+                f"Connection failed: no response within {self._TEST_TIMEOUT:.0f}s",
+            )
         except Exception as e:
-            self.status_label.setText(f"Error: {str(e)[:50]}")
-            self.status_label.setStyleSheet("color: #FF4500;")
+            self._set_status("err", f"Error: {str(e)[:50]}")
             QMessageBox.critical(self, "Error", f"Connection failed: {str(e)}")
         finally:
-            await client.close()
             self.test_btn.setEnabled(True)
             self.test_btn.setText("Test Connection")
 
     def _clear_memory(self):
         """Clear all memory."""
-        reply = QMessageBox.question(
-            self,
+        # open() instead of exec(): no nested event loop, so pending
+        # coroutines keep running while the confirmation is shown
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
             "Confirm",
             "Are you sure you want to clear all memory? This cannot be undone.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self,
         )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(self._on_clear_memory_confirmed)
+        box.open()
 
-        if reply == QMessageBox.StandardButton.Yes:
-            asyncio.create_task(self._do_clear_memory())
+    def _on_clear_memory_confirmed(self, result: int):
+        """Start clearing memory if the user confirmed."""
+        if result == QMessageBox.StandardButton.Yes.value:
+            self._clear_task = self._spawn(self._do_clear_memory(), "clear memory")
 
     async def _do_clear_memory(self):
         """Clear memory asynchronously."""
@@ -796,56 +1217,59 @@ class SettingsDialog(QDialog):
 
     def _apply_settings(self):
         """Apply settings without closing dialog."""
-        self._save_settings()
-        QMessageBox.information(self, "Success", "Settings applied!")
+        try:
+            self._save_settings()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to apply settings: {str(e)}")
+            return
+
+        # Inline confirmation instead of a modal popup, reverted shortly after;
+        # a repeat Apply keeps the status from before the first one
+        if not self._status_revert_timer.isActive():
+            self._status_revert = (
+                self.status_label.property("state") or "", self.status_label.text()
+            )
+        self._set_status("ok", "Settings applied")
+        self._status_revert_timer.start()
 
     def _save_settings(self):
         """Save settings."""
+        if not self._is_tab_built(self._API_TAB):
+            return  # Closed before anything was loaded, so nothing changed
+        config = self.orchestrator.config
+        ollama_was_enabled = config.ollama_enabled
+
+        # .env updates are collected here and written in one pass at the end
+        env: dict[str, str] = {}
+
+        # Write only the fields that differ from what was last loaded/saved
+        changed = set()
+        for name, tab, getter, setter in self._field_specs:
+            if not self._is_tab_built(tab):
+                continue
+            value = getter()
+            if value and value != self._initial.get(name):
+                setter(value, env)
+                self._initial[name] = value
+                changed.add(name)
+
+        # (Re)initialize the client once if its key or URL changed, or when
+        # coming back from Ollama; set_api_key uses config.nvidia_base_url
         api_key = self.api_key_input.text().strip()
-        base_url = self.base_url_input.text().strip()
-
-        # Update base URL first (before recreating client)
-        if base_url:
-            self.orchestrator.config.nvidia_base_url = base_url
-
-        # Save API key to secure storage and (re)initialize the client
-        if api_key:
-            SecureStorage.store_api_key(api_key)
-            # set_api_key will use the current config.nvidia_base_url
+        ollama_disabled = ollama_was_enabled and not self.ollama_enabled_check.isChecked()
+        if api_key and (changed & {"api_key", "base_url"} or ollama_disabled):
             self.orchestrator.set_api_key(api_key)
-            # Also write to .env so it persists across sessions
-            self._update_env_file("NVIDIA_API_KEY", api_key)
-
-        if base_url:
-            self._update_env_file("NVIDIA_BASE_URL", base_url)
-
-        # Save Google API key
-        google_key = self.google_api_key_input.text().strip()
-        if google_key:
-            SecureStorage.store_google_api_key(google_key)
-            self.orchestrator.config.google_api_key = google_key
-            self._update_env_file("GOOGLE_API_KEY", google_key)
-
-        # Save screen capture settings
-        config = self.orchestrator.config
-        config.screen_capture_vision = self.screen_vision_check.isChecked()
-        config.screen_capture_gemini = self.screen_gemini_check.isChecked()
-        config.screen_capture_monitor = self.monitor_combo.currentData() or 0
-        config.screen_capture_interval = self.capture_interval_spin.value()
-        self._update_env_file(
-            "SCREEN_CAPTURE_VISION", str(config.screen_capture_vision).lower()
-        )
-        self._update_env_file(
-            "SCREEN_CAPTURE_GEMINI", str(config.screen_capture_gemini).lower()
-        )
-        self._update_env_file("SCREEN_CAPTURE_MONITOR", str(config.screen_capture_monitor))
-        self._update_env_file("SCREEN_CAPTURE_INTERVAL", str(config.screen_capture_interval))
 
-        # Save model selection
-        model = self.model_combo.currentText().strip()
-        if model:
-            self.orchestrator.config.default_model = model
-            self._update_env_file("DEFAULT_MODEL", model)
+        # Save screen capture settings (untouched if the tab was never opened)
+        if self._is_tab_built(self._SCREEN_TAB):
+            config.screen_capture_vision = self.screen_vision_check.isChecked()
+            config.screen_capture_gemini = self.screen_gemini_check.isChecked()
+            config.screen_capture_monitor = self.monitor_combo.currentData() or 0
+            config.screen_capture_interval = self.capture_interval_spin.value()
+            env["SCREEN_CAPTURE_VISION"] = str(config.screen_capture_vision).lower()
+            env["SCREEN_CAPTURE_GEMINI"] = str(config.screen_capture_gemini).lower()
+            env["SCREEN_CAPTURE_MONITOR"] = str(config.screen_capture_monitor)
+            env["SCREEN_CAPTURE_INTERVAL"] = str(config.screen_capture_interval)
 
         # Ollama settings
         config.ollama_enabled = self.ollama_enabled_check.isChecked()
@@ -853,47 +1277,77 @@ class SettingsDialog(QDialog):
         config.ollama_base_url = ollama_url
         ollama_model = self.ollama_model_input.text().strip() or "llama3"
         config.ollama_model = ollama_model
-        self._update_env_file("OLLAMA_ENABLED", str(config.ollama_enabled).lower())
-        self._update_env_file("OLLAMA_BASE_URL", ollama_url)
-        self._update_env_file("OLLAMA_MODEL", ollama_model)
+        env["OLLAMA_ENABLED"] = str(config.ollama_enabled).lower()
+        env["OLLAMA_BASE_URL"] = ollama_url
+        env["OLLAMA_MODEL"] = ollama_model
 
         # When Ollama is enabled, swap the API client to point at Ollama
         if config.ollama_enabled:
             self.orchestrator.set_api_key("ollama", base_url=ollama_url)
             config.default_model = ollama_model
-            self._update_env_file("DEFAULT_MODEL", ollama_model)
+            env["DEFAULT_MODEL"] = ollama_model
+            # Re-apply the combo's model once Ollama is switched off again
+            self._initial["model"] = ollama_model
+
+        self._update_env_file(env)
 
         # Update status
         if self.orchestrator.is_ready:
-            self.status_label.setText("Configured")
-            self.status_label.setStyleSheet("color: #FF8C42;")
+            self._set_status("ok", "Configured")
 
-        self.settings_changed.emit()
+        # Apply followed by OK notifies listeners once
+        self._changed_timer.start()
         logger.info("Settings saved")
 
-    def _update_env_file(self, key: str, value: str):
-        """Update a key in the .env file, or add it if missing."""
-        from pathlib import Path
+    def _save_api_key(self, api_key: str, env: dict[str, str]):
+        """Persist the NVIDIA API key to secure storage and .env."""
+        from src.utils.secure_storage import SecureStorage
 
-        env_path = Path(__file__).resolve().parent.parent.parent / ".env"
-        try:
-            if env_path.exists():
-                lines = env_path.read_text(encoding="utf-8").splitlines()
-            else:
-                lines = []
+        SecureStorage.store_api_key(api_key)
+        env["NVIDIA_API_KEY"] = api_key
+
+    def _save_google_api_key(self, google_key: str, env: dict[str, str]):
+        """Persist the Google API key to secure storage and .env."""
+        from src.utils.secure_storage import SecureStorage
+
+        SecureStorage.store_google_api_key(google_key)
+        self.orchestrator.config.google_api_key = google_key
+        env["GOOGLE_API_KEY"] = google_key
 
-            found = False
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                if stripped.startswith(f"{key}=") or stripped.startswith(f"{key} ="):
-                    lines[i] = f"{key}={value}"
-                    found = True
-                    break
+    def _save_base_url(self, base_url: str, env: dict[str, str]):
+        """Persist the NVIDIA base URL."""
+        self.orchestrator.config.nvidia_base_url = base_url
+        env["NVIDIA_BASE_URL"] = base_url
 
-            if not found:
-                lines.append(f"{key}={value}")
+    def _save_model(self, model: str, env: dict[str, str]):
+        """Persist the default model selection."""
+        self.orchestrator.config.default_model = model
+        env["DEFAULT_MODEL"] = model
 
-            env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    def _update_env_file(self, updates: dict[str, str]):
+        """Update keys in the .env file, adding any that are missing.
+
+        The file is read and written once however many keys change.
+        """
+        if not updates:
+            return
+        try:
+            text = ""
+            if ENV_PATH.exists():
+                with ENV_PATH.open(encoding="utf-8", newline="") as f:
+                    text = f.read()
+            newline = "\r\n" if "\r\n" in text else "\n"
+
+            for key, value in updates.items():
+                line = f"{key}={value}"
+                text, found = _env_key_re(key).subn(lambda _: line, text, count=1)
+                if not found:
+                    if text and not text.endswith("\n"):
+                        text += newline
+                    text += line + newline
+
+            with ENV_PATH.open("w", encoding="utf-8", newline="") as f:
+                f.write(text)
         except Exception as e:
             logger.warning(f"Could not update .env file: {e}")
 
@@ -901,3 +1355,17 @@ class SettingsDialog(QDialog):
         """Handle OK button."""
         self._save_settings()
         super().accept()
+
+    def done(self, result: int):
+        """Cancel in-flight work when the dialog closes (OK, Cancel or close)."""
+        # A memory clear is left to finish: it was confirmed by the user and
+        # stopping it half-way would leave memory partially cleared.
+        for task in (
+            self._keyring_task, self._test_task, self._monitors_task, self._capture_task
+        ):
+            if task is not None and not task.done():
+                task.cancel()
+        if self._client_cache is not None:
+            _close_client_later(self._client_cache[1])
+            self._client_cache = None
+        super().done(result)
@@ -1,7 +1,4 @@
 """Tasks Panel - Active and completed task tracking UI."""
-import asyncio
-from typing import Optional
-
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QFrame,
@@ -16,7 +13,6 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from loguru import logger
 
 
 class TasksPanel(QWidget):
@@ -24,11 +20,19 @@ class TasksPanel(QWidget):
 
     def __init__(self, task_planner=None, parent=None):
         super().__init__(parent)
-        self.task_planner = task_planner
-        self._refresh_timer = QTimer()
-        self._refresh_timer.timeout.connect(self._refresh_tasks)
-        self._refresh_timer.start(1000)  # Refresh every second
+        self.task_planner = None
+        self._last_version = -1  # Planner version the list was last built from
+        self._shown_detail = None  # (task_id, planner version) in the detail pane
+        self._last_active_count = -1
+        self._list_ids: tuple = ()  # Task IDs the list rows were last synced to
+        self._items: dict[str, QListWidgetItem] = {}  # task_id -> list row item
+        # Planner changes schedule a refresh; a burst of them collapses into one
+        self._pending_refresh = QTimer(self)
+        self._pending_refresh.setSingleShot(True)
+        self._pending_refresh.setInterval(0)
+        self._pending_refresh.timeout.connect(self._refresh_tasks)
         self._setup_ui()
+        self.set_task_planner(task_planner)
 
     def _setup_ui(self):
         """Setup tasks panel UI."""
@@ -76,6 +80,8 @@ class TasksPanel(QWidget):
 
         self.tasks_list = QListWidget()
         self.tasks_list.setMinimumWidth(220)
+        # Rows are single-line text, so one size hint serves them all
+        self.tasks_list.setUniformItemSizes(True)
         self.tasks_list.currentRowChanged.connect(self._on_task_selected)
         left_layout.addWidget(self.tasks_list)
 
@@ -122,69 +128,88 @@ class TasksPanel(QWidget):
 
     def _refresh_tasks(self):
         """Refresh task list from planner."""
-        if not self.task_planner:
+        # Hidden panels catch up in showEvent
+        if not self.task_planner or not self.isVisible():
+            return
+        # Nothing changed since the last refresh
+        if self.task_planner.version == self._last_version:
             return
+        self._last_version = self.task_planner.version
 
         all_tasks = self.task_planner.get_all_tasks()
-        active = [t for t in all_tasks if not t.is_complete]
-        self.active_count.setText(f"{len(active)} active")
-
-        # Rebuild list
-        current_ids = set()
-        for i in range(self.tasks_list.count()):
-            item = self.tasks_list.item(i)
-            if item:
-                current_ids.add(item.data(Qt.ItemDataRole.UserRole))
-
-        new_ids = {t.task_id for t in all_tasks}
-        if current_ids != new_ids:
-            selected_id = None
-            current_item = self.tasks_list.currentItem()
-            if current_item:
-                selected_id = current_item.data(Qt.ItemDataRole.UserRole)
-
-            self.tasks_list.clear()
-            for task in reversed(all_tasks):  # newest first
-                status_icons = {
-                    "pending": "○",
-                    "in_progress": "⟳",
-                    "completed": "✓",
-                    "failed": "✗",
-                    "paused": "⏸",
-                }
-                icon = status_icons.get(task.status.value, "?")
-                label = f"{icon} {task.goal[:40]}"
-                item = QListWidgetItem(label)
-                item.setData(Qt.ItemDataRole.UserRole, task.task_id)
-                self.tasks_list.addItem(item)
-
-                # Restore selection
-                if task.task_id == selected_id:
-                    self.tasks_list.setCurrentItem(item)
+        n_active = sum(1 for t in all_tasks if not t.is_complete)
+        if n_active != self._last_active_count:
+            self._last_active_count = n_active
+            self.active_count.setText(f"{n_active} active")
+
+        # Update the list in place: drop tasks that aged out, add new ones at
+        # the top and relabel the rest, instead of clearing and rebuilding
+        role = Qt.ItemDataRole.UserRole
+        task_ids = tuple(t.task_id for t in all_tasks)
+        # Signals stay blocked so removing rows does not fire a selection
+        # callback per row; the detail pane is refreshed once afterwards
+        self.tasks_list.setUpdatesEnabled(False)
+        self.tasks_list.blockSignals(True)
+        try:
+            # Rows only need walking when the set of tasks changed
+            if task_ids != self._list_ids:
+                wanted = set(task_ids)
+                for row in reversed(range(self.tasks_list.count())):
+                    task_id = self.tasks_list.item(row).data(role)
+                    if task_id not in wanted:
+                        self.tasks_list.takeItem(row)
+                        del self._items[task_id]
+                self._list_ids = task_ids
+
+            for task in all_tasks:  # oldest first, so new rows end up newest first
+                label = task.list_label
+                item = self._items.get(task.task_id)
+                if item is None:
+                    item = QListWidgetItem(label)
+                    item.setData(role, task.task_id)
+                    self.tasks_list.insertItem(0, item)
+                    self._items[task.task_id] = item
+                elif item.text() != label:
+                    item.setText(label)
+        finally:
+            self.tasks_list.blockSignals(False)
+            self.tasks_list.setUpdatesEnabled(True)
+
+        self._on_task_selected(self.tasks_list.currentRow())
 
     def _on_task_selected(self, row: int):
         """Show task detail for selected task."""
         item = self.tasks_list.item(row)
         if not item:
             self.cancel_btn.setEnabled(False)
+            self._shown_detail = None
             return
 
         task_id = item.data(Qt.ItemDataRole.UserRole)
         if not task_id or not self.task_planner:
             return
 
-        # Find task
-        all_tasks = self.task_planner.get_all_tasks()
-        task = next((t for t in all_tasks if t.task_id == task_id), None)
+        # Same task, and nothing in the planner changed since it was shown
+        detail_key = (task_id, self.task_planner.version)
+        if detail_key == self._shown_detail:
+            return
+        self._shown_detail = detail_key
+
+        task = self.task_planner.get_task(task_id)
         if not task:
             return
 
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(task.progress_pct)
+        # Show progress (setVisible re-lays out the pane, so only when hidden)
+        if self.progress_bar.isHidden():
+            self.progress_bar.setVisible(True)
+        progress = task.progress_pct
+        if self.progress_bar.value() != progress:
+            self.progress_bar.setValue(progress)
 
         # Enable cancel for active tasks
-        self.cancel_btn.setEnabled(not task.is_complete)
+        can_cancel = not task.is_complete
+        if self.cancel_btn.isEnabled() != can_cancel:
+            self.cancel_btn.setEnabled(can_cancel)
 
         # Show detail
         self.detail_text.setPlainText(task.get_summary())
@@ -199,6 +224,24 @@ class TasksPanel(QWidget):
             self.task_planner.cancel_task(task_id)
             self._refresh_tasks()
 
+    def showEvent(self, event):
+        """Catch up on changes made while hidden."""
+        super().showEvent(event)
+        self._refresh_tasks()
+
+    def _schedule_refresh(self):
+        """Refresh on the next event-loop turn (called on planner changes)."""
+        self._pending_refresh.start()
+
     def set_task_planner(self, planner):
-        """Set the task planner."""
+        """Set the task planner and follow its change notifications."""
+        if planner is self.task_planner:
+            return
+        if self.task_planner:
+            self.task_planner.remove_tasks_changed_callback(self._schedule_refresh)
         self.task_planner = planner
+        self._last_version = -1
+        self._shown_detail = None
+        if planner:
+            planner.on_tasks_changed(self._schedule_refresh)
+            self._schedule_refresh()
@@ -7,9 +7,13 @@ Industry-standard advanced QSS with:
   • Ultra-refined scrollbars, inputs, and buttons
   • Subtle surface elevation hierarchy
 """
+import re
+from functools import cache
+from types import MappingProxyType
+from typing import Literal, Mapping
 
 # ── Panther Dark (default) ──────────────────────────────────────────────────
-DARK_COLORS = {
+DARK_COLORS = MappingProxyType({
     "background": "#0A0A0A",        # pure black
     "surface": "#111111",           # sidebar
     "surface_variant": "#1a1a1a",   # hover states
@@ -33,10 +37,10 @@ DARK_COLORS = {
     "scrollbar_bg": "transparent",
     "scrollbar_handle": "#2a2a2a",
     "glow": "rgba(255, 107, 53, 0.25)",
-}
+})
 
 # ── Light theme (unchanged, for completeness) ──────────────────────────────
-LIGHT_COLORS = {
+LIGHT_COLORS = MappingProxyType({
     "background": "#faf8f5",
     "surface": "#ffffff",
     "surface_variant": "#f5f0ea",
@@ -60,22 +64,161 @@ LIGHT_COLORS = {
     "scrollbar_bg": "transparent",
     "scrollbar_handle": "#d0c8c0",
     "glow": "rgba(255, 107, 53, 0.15)",
-}
+})
 
 
-def get_stylesheet(c: dict) -> str:
-    """Generate QSS stylesheet from color palette — advanced effects."""
-    return f"""
+# Rules that use no palette colour, shared verbatim by every theme. They are
+# emitted ahead of the palette rules, so a coloured :focus/:checked rule below
+# still wins over a static :hover one on the same widget.
+_STATIC_QSS = """
+    /* ═══ MESSAGE BUBBLES — elevated cards with glow ════════════════════ */
+    QFrame#userMessage:hover {
+        border: 1px solid #333333;
+    }
+    QFrame#aiMessage {
+        background-color: transparent;
+        border: none;
+    }
+
+    /* ═══ INPUT AREA — elevated glass panel ═════════════════════════════ */
+    QFrame#inputFrame {
+        background-color: qlineargradient(
+            x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1a1a1a, stop:1 #141414
+        );
+        border: 1px solid #2a2a2a;
+        border-radius: 24px;
+    }
+    QFrame#inputFrame:hover {
+        border: 1px solid #333333;
+    }
+
+    /* ═══ SCROLLBARS — ultra-thin, auto-fade feel ═══════════════════════ */
+    QScrollBar:vertical {
+        background-color: transparent;
+        width: 5px;
+        margin: 4px 1px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: rgba(255, 255, 255, 0.08);
+        min-height: 40px;
+        border-radius: 2px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: rgba(255, 107, 53, 0.5);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: transparent;
+    }
+    QScrollBar:horizontal {
+        background-color: transparent;
+        height: 5px;
+        margin: 1px 4px;
+    }
+    QScrollBar::handle:horizontal {
+        background-color: rgba(255, 255, 255, 0.08);
+        min-width: 40px;
+        border-radius: 2px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background-color: rgba(255, 107, 53, 0.5);
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        background: transparent;
+    }
+
+    /* ═══ INPUTS — shared glass field; per-widget blocks override ═════ */
+    QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover {
+        border-color: #333333;
+    }
+
+    /* ═══ COMBO BOX — glass dropdown ═══════════════════════════════════ */
+    QComboBox:hover {
+        border-color: rgba(255, 107, 53, 0.5);
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 28px;
+        border: none;
+        background: transparent;
+    }
+    QComboBox::down-arrow {
+        width: 10px;
+        height: 10px;
+        image: none;
+    }
+    QComboBox QAbstractItemView::item {
+        min-height: 32px;
+        padding: 6px 12px;
+        border-radius: 6px;
+    }
+    QComboBox QAbstractItemView::item:hover {
+        background-color: rgba(255, 255, 255, 0.06);
+    }
+
+    /* ═══ LINE EDIT — glowing focus border ═════════════════════════════ */
+    QLineEdit {
+        padding: 8px 12px;
+        selection-background-color: rgba(255, 107, 53, 0.35);
+    }
+
+    /* ═══ CHECKBOXES — premium toggle style ═════════════════════════════ */
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 5px;
+        border: 1px solid #333333;
+        background-color: rgba(255, 255, 255, 0.04);
+    }
+    QCheckBox::indicator:hover {
+        border-color: rgba(255, 107, 53, 0.5);
+        background-color: rgba(255, 107, 53, 0.06);
+    }
+
+    /* ═══ SPIN BOX — consistent glass style ════════════════════════════ */
+    QSpinBox, QDoubleSpinBox {
+        padding: 6px 10px;
+    }
+
+    /* ═══ MENU — glass dropdown ════════════════════════════════════════ */
+    QMenu::item {
+        padding: 8px 24px 8px 16px;
+        border-radius: 6px;
+    }
+    QMenu::separator {
+        height: 1px;
+        background: #2a2a2a;
+        margin: 4px 8px;
+    }
+
+    /* ═══ SLIDER — premium track + handle ═══════════════════════════════ */
+    QSlider::groove:horizontal {
+        height: 4px;
+        background: rgba(255, 255, 255, 0.08);
+        border-radius: 2px;
+    }
+"""
+
+# QSS with {palette_key} placeholders (literal braces doubled), filled by
+# str.format_map in _build_stylesheet along with the derived *_gradient keys
+_QSS_TEMPLATE = """
     /* ═══════════════════════════════════════════════════════════════════
        GLOBAL — Panther Premium Dark UI
        ═══════════════════════════════════════════════════════════════════ */
     QMainWindow {{
-        background-color: {c["background"]};
-        color: {c["text"]};
+        background-color: {background};
+        color: {text};
     }}
     QWidget {{
-        background-color: {c["background"]};
-        color: {c["text"]};
+        background-color: {background};
+        color: {text};
         font-family: 'Inter', 'Segoe UI', -apple-system, sans-serif;
         font-size: 13px;
     }}
@@ -84,14 +227,14 @@ def get_stylesheet(c: dict) -> str:
     QWidget#sidebar {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:0, y2:1,
-            stop:0 #131313, stop:0.5 {c["surface"]}, stop:1 #0d0d0d
+            stop:0 #131313, stop:0.5 {surface}, stop:1 #0d0d0d
         );
-        border-right: 1px solid {c["border"]};
+        border-right: 1px solid {border};
     }}
 
     /* ═══ CHAT AREA ═════════════════════════════════════════════════════ */
     QScrollArea#chatArea {{
-        background-color: {c["background"]};
+        background-color: {background};
         border: none;
     }}
 
@@ -99,40 +242,21 @@ def get_stylesheet(c: dict) -> str:
     QFrame#userMessage {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:1, y2:1,
-            stop:0 #1e1e1e, stop:1 {c["user_message_bg"]}
+            stop:0 #1e1e1e, stop:1 {user_message_bg}
         );
         border-radius: 18px;
         border: 1px solid #2a2a2a;
     }}
-    QFrame#userMessage:hover {{
-        border: 1px solid #333333;
-    }}
-    QFrame#aiMessage {{
-        background-color: transparent;
-        border: none;
-    }}
 
     /* ═══ INPUT AREA — elevated glass panel ═════════════════════════════ */
     QFrame#inputArea {{
-        background-color: {c["background"]};
+        background-color: {background};
         border-top: none;
     }}
 
-    QFrame#inputFrame {{
-        background-color: qlineargradient(
-            x1:0, y1:0, x2:0, y2:1,
-            stop:0 #1a1a1a, stop:1 #141414
-        );
-        border: 1px solid #2a2a2a;
-        border-radius: 24px;
-    }}
-    QFrame#inputFrame:hover {{
-        border: 1px solid #333333;
-    }}
-
     QTextEdit#messageInput {{
         background-color: transparent;
-        color: {c["text"]};
+        color: {text};
         border: none;
         padding: 10px 16px;
         font-size: 14px;
@@ -143,10 +267,7 @@ def get_stylesheet(c: dict) -> str:
 
     /* ═══ BUTTONS — premium with gradient + glow states ═════════════════ */
     QPushButton {{
-        background-color: qlineargradient(
-            x1:0, y1:0, x2:0, y2:1,
-            stop:0 {c["primary_variant"]}, stop:1 {c["primary"]}
-        );
+        background-color: {primary_gradient};
         color: #0A0A0A;
         border: none;
         border-radius: 12px;
@@ -158,35 +279,35 @@ def get_stylesheet(c: dict) -> str:
     QPushButton:hover {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:0, y2:1,
-            stop:0 #FFa060, stop:1 {c["primary_variant"]}
+            stop:0 #FFa060, stop:1 {primary_variant}
         );
     }}
     QPushButton:pressed {{
-        background-color: {c["primary"]};
+        background-color: {primary};
         padding-top: 9px;
         padding-bottom: 7px;
     }}
     QPushButton:disabled {{
-        background-color: {c["surface_variant"]};
-        color: {c["text_tertiary"]};
+        background-color: {surface_variant};
+        color: {text_tertiary};
     }}
 
     /* Secondary / ghost button — glass style */
     QPushButton#secondary {{
         background-color: rgba(255, 255, 255, 0.04);
-        color: {c["text"]};
-        border: 1px solid {c["border"]};
+        color: {text};
+        border: 1px solid {border};
     }}
     QPushButton#secondary:hover {{
         background-color: rgba(255, 107, 53, 0.08);
         border-color: rgba(255, 107, 53, 0.4);
-        color: {c["primary_variant"]};
+        color: {primary_variant};
     }}
 
     /* Sidebar navigation — sleek pill buttons */
     QPushButton#sidebarButton {{
         background-color: transparent;
-        color: {c["text_secondary"]};
+        color: {text_secondary};
         border: none;
         border-radius: 10px;
         padding: 10px 14px;
@@ -200,185 +321,99 @@ def get_stylesheet(c: dict) -> str:
             x1:0, y1:0, x2:1, y2:0,
             stop:0 rgba(255,255,255,0.06), stop:1 rgba(255,255,255,0.02)
         );
-        color: {c["text"]};
+        color: {text};
     }}
     QPushButton#sidebarButton:checked {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:1, y2:0,
             stop:0 rgba(255,107,53,0.15), stop:1 rgba(255,107,53,0.06)
         );
-        color: {c["primary"]};
+        color: {primary};
         font-weight: 600;
     }}
 
     /* ═══ LABELS ════════════════════════════════════════════════════════ */
     QLabel {{
-        color: {c["text"]};
+        color: {text};
         background: transparent;
         letter-spacing: 0.1px;
     }}
     QLabel#title {{
         font-size: 16px;
         font-weight: 700;
-        color: {c["primary"]};
+        color: {primary};
         letter-spacing: -0.3px;
     }}
     QLabel#subtitle {{
         font-size: 13px;
-        color: {c["text_secondary"]};
+        color: {text_secondary};
         letter-spacing: 0.2px;
     }}
 
-    /* ═══ SCROLLBARS — ultra-thin, auto-fade feel ═══════════════════════ */
-    QScrollBar:vertical {{
-        background-color: transparent;
-        width: 5px;
-        margin: 4px 1px;
-    }}
-    QScrollBar::handle:vertical {{
-        background-color: rgba(255, 255, 255, 0.08);
-        min-height: 40px;
-        border-radius: 2px;
-    }}
-    QScrollBar::handle:vertical:hover {{
-        background-color: rgba(255, 107, 53, 0.5);
-    }}
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-        height: 0;
-    }}
-    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-        background: transparent;
-    }}
-    QScrollBar:horizontal {{
-        background-color: transparent;
-        height: 5px;
-        margin: 1px 4px;
-    }}
-    QScrollBar::handle:horizontal {{
-        background-color: rgba(255, 255, 255, 0.08);
-        min-width: 40px;
-        border-radius: 2px;
-    }}
-    QScrollBar::handle:horizontal:hover {{
-        background-color: rgba(255, 107, 53, 0.5);
-    }}
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-        width: 0;
+    /* ═══ INPUTS — shared glass field; per-widget blocks override ═════ */
+    QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox {{
+        background-color: qlineargradient(
+            x1:0, y1:0, x2:0, y2:1,
+            stop:0 #161616, stop:1 {surface}
+        );
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 10px;
+        font-size: 13px;
     }}
-    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-        background: transparent;
+    QComboBox:focus, QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
+        border: 1px solid {primary};
     }}
 
     /* ═══ COMBO BOX — glass dropdown ═══════════════════════════════════ */
     QComboBox {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:0, y2:1,
-            stop:0 #181818, stop:1 {c["surface"]}
+            stop:0 #181818, stop:1 {surface}
         );
-        color: {c["text"]};
-        border: 1px solid {c["border"]};
-        border-radius: 10px;
         padding: 8px 32px 8px 12px;
         min-height: 32px;
-        font-size: 13px;
-    }}
-    QComboBox:hover {{
-        border-color: rgba(255, 107, 53, 0.5);
-    }}
-    QComboBox:focus {{
-        border: 1px solid {c["primary"]};
-    }}
-    QComboBox::drop-down {{
-        subcontrol-origin: padding;
-        subcontrol-position: top right;
-        width: 28px;
-        border: none;
-        background: transparent;
-    }}
-    QComboBox::down-arrow {{
-        width: 10px;
-        height: 10px;
-        image: none;
     }}
     QComboBox QAbstractItemView {{
         background-color: #181818;
-        color: {c["text"]};
+        color: {text};
         border: 1px solid #2a2a2a;
         selection-background-color: rgba(255, 107, 53, 0.2);
-        selection-color: {c["primary_variant"]};
+        selection-color: {primary_variant};
         outline: none;
         padding: 4px;
         border-radius: 10px;
     }}
-    QComboBox QAbstractItemView::item {{
-        min-height: 32px;
-        padding: 6px 12px;
-        border-radius: 6px;
-    }}
-    QComboBox QAbstractItemView::item:hover {{
-        background-color: rgba(255, 255, 255, 0.06);
-    }}
-
-    /* ═══ LINE EDIT — glowing focus border ═════════════════════════════ */
-    QLineEdit {{
-        background-color: qlineargradient(
-            x1:0, y1:0, x2:0, y2:1,
-            stop:0 #161616, stop:1 {c["surface"]}
-        );
-        color: {c["text"]};
-        border: 1px solid {c["border"]};
-        border-radius: 10px;
-        padding: 8px 12px;
-        font-size: 13px;
-        selection-background-color: rgba(255, 107, 53, 0.35);
-    }}
-    QLineEdit:hover {{
-        border-color: #333333;
-    }}
-    QLineEdit:focus {{
-        border: 1px solid {c["primary"]};
-    }}
 
     /* ═══ CHECKBOXES — premium toggle style ═════════════════════════════ */
     QCheckBox {{
-        color: {c["text"]};
+        color: {text};
         spacing: 8px;
         font-size: 13px;
     }}
-    QCheckBox::indicator {{
-        width: 18px;
-        height: 18px;
-        border-radius: 5px;
-        border: 1px solid #333333;
-        background-color: rgba(255, 255, 255, 0.04);
-    }}
-    QCheckBox::indicator:hover {{
-        border-color: rgba(255, 107, 53, 0.5);
-        background-color: rgba(255, 107, 53, 0.06);
-    }}
     QCheckBox::indicator:checked {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:1, y2:1,
-            stop:0 {c["primary_variant"]}, stop:1 {c["primary"]}
+            stop:0 {primary_variant}, stop:1 {primary}
         );
-        border-color: {c["primary"]};
+        border-color: {primary};
     }}
 
     /* ═══ GROUP BOX — subtle card container ═════════════════════════════ */
     QGroupBox {{
-        border: 1px solid {c["border"]};
+        border: 1px solid {border};
         border-radius: 14px;
         margin-top: 14px;
         padding-top: 16px;
         font-weight: 600;
-        color: {c["text"]};
+        color: {text};
         background-color: rgba(255, 255, 255, 0.02);
     }}
     QGroupBox::title {{
         subcontrol-origin: margin;
         left: 16px;
         padding: 0 8px;
-        color: {c["text_secondary"]};
+        color: {text_secondary};
         letter-spacing: 0.3px;
     }}
 
@@ -386,10 +421,10 @@ def get_stylesheet(c: dict) -> str:
     QDialog {{
         background-color: qlineargradient(
             x1:0, y1:0, x2:0, y2:1,
-            stop:0 #121212, stop:1 {c["background"]}
+            stop:0 #121212, stop:1 {background}
         );
-        color: {c["text"]};
-        border: 1px solid {c["border"]};
+        color: {text};
+        border: 1px solid {border};
         border-radius: 16px;
     }}
 
@@ -399,62 +434,40 @@ def get_stylesheet(c: dict) -> str:
         border-radius: 5px;
         background-color: rgba(255, 255, 255, 0.06);
         text-align: center;
-        color: {c["text"]};
+        color: {text};
         font-size: 11px;
     }}
     QProgressBar::chunk {{
-        background-color: qlineargradient(
-            x1:0, y1:0, x2:1, y2:0,
-            stop:0 {c["primary"]}, stop:1 {c["secondary"]}
-        );
+        background-color: {accent_gradient};
         border-radius: 5px;
     }}
 
     /* ═══ TAB WIDGET — underline accent ═════════════════════════════════ */
     QTabWidget::pane {{
-        border: 1px solid {c["border"]};
-        background-color: {c["background"]};
+        border: 1px solid {border};
+        background-color: {background};
         border-radius: 12px;
     }}
     QTabBar::tab {{
         background-color: transparent;
-        color: {c["text_secondary"]};
+        color: {text_secondary};
         padding: 10px 20px;
         border: none;
         font-weight: 500;
         letter-spacing: 0.3px;
     }}
     QTabBar::tab:selected {{
-        color: {c["primary"]};
-        border-bottom: 2px solid {c["primary"]};
+        color: {primary};
+        border-bottom: 2px solid {primary};
     }}
     QTabBar::tab:hover:!selected {{
-        color: {c["text"]};
-    }}
-
-    /* ═══ SPIN BOX — consistent glass style ════════════════════════════ */
-    QSpinBox, QDoubleSpinBox {{
-        background-color: qlineargradient(
-            x1:0, y1:0, x2:0, y2:1,
-            stop:0 #161616, stop:1 {c["surface"]}
-        );
-        color: {c["text"]};
-        border: 1px solid {c["border"]};
-        border-radius: 10px;
-        padding: 6px 10px;
-        font-size: 13px;
-    }}
-    QSpinBox:hover, QDoubleSpinBox:hover {{
-        border-color: #333333;
-    }}
-    QSpinBox:focus, QDoubleSpinBox:focus {{
-        border: 1px solid {c["primary"]};
+        color: {text};
     }}
 
     /* ═══ TOOLTIPS — floating glass chip ════════════════════════════════ */
     QToolTip {{
         background-color: #1e1e1e;
-        color: {c["text"]};
+        color: {text};
         border: 1px solid #333333;
         border-radius: 8px;
         padding: 6px 10px;
@@ -464,69 +477,106 @@ def get_stylesheet(c: dict) -> str:
     /* ═══ MENU — glass dropdown ════════════════════════════════════════ */
     QMenu {{
         background-color: #181818;
-        color: {c["text"]};
+        color: {text};
         border: 1px solid #2a2a2a;
         border-radius: 12px;
         padding: 6px;
     }}
-    QMenu::item {{
-        padding: 8px 24px 8px 16px;
-        border-radius: 6px;
-    }}
     QMenu::item:selected {{
         background-color: rgba(255, 107, 53, 0.12);
-        color: {c["primary_variant"]};
-    }}
-    QMenu::separator {{
-        height: 1px;
-        background: #2a2a2a;
-        margin: 4px 8px;
+        color: {primary_variant};
     }}
 
     /* ═══ SLIDER — premium track + handle ═══════════════════════════════ */
-    QSlider::groove:horizontal {{
-        height: 4px;
-        background: rgba(255, 255, 255, 0.08);
-        border-radius: 2px;
-    }}
     QSlider::handle:horizontal {{
         width: 14px;
         height: 14px;
         margin: -5px 0;
         border-radius: 7px;
-        background-color: qlineargradient(
-            x1:0, y1:0, x2:0, y2:1,
-            stop:0 {c["primary_variant"]}, stop:1 {c["primary"]}
-        );
+        background-color: {primary_gradient};
     }}
     QSlider::handle:horizontal:hover {{
-        background-color: {c["secondary"]};
+        background-color: {secondary};
     }}
     QSlider::sub-page:horizontal {{
-        background: qlineargradient(
-            x1:0, y1:0, x2:1, y2:0,
-            stop:0 {c["primary"]}, stop:1 {c["secondary"]}
-        );
+        background: {accent_gradient};
         border-radius: 2px;
     }}
 
     /* ═══ STATUS BAR ═══════════════════════════════════════════════════ */
     QStatusBar {{
-        background-color: {c["surface"]};
-        color: {c["text_secondary"]};
-        border-top: 1px solid {c["border"]};
+        background-color: {surface};
+        color: {text_secondary};
+        border-top: 1px solid {border};
         font-size: 11px;
     }}
     """
 
 
+def get_stylesheet(c: Mapping[str, str]) -> str:
+    """Generate QSS stylesheet from color palette — advanced effects."""
+    c = dict(c)
+    # Gradients used by several rules, formatted once per palette
+    c["primary_gradient"] = (
+        "qlineargradient(x1:0, y1:0, x2:0, y2:1, "
+        f"stop:0 {c['primary_variant']}, stop:1 {c['primary']})"
+    )
+    c["accent_gradient"] = (
+        "qlineargradient(x1:0, y1:0, x2:1, y2:0, "
+        f"stop:0 {c['primary']}, stop:1 {c['secondary']})"
+    )
+    return _static_qss() + _minify_qss(_QSS_TEMPLATE.format_map(c))
+
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r" ?([{};]) ?")
+
+
+def _minify_qss(qss: str) -> str:
+    """Drop comments and layout whitespace, which Qt would otherwise re-lex."""
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_SPACE.sub(" ", qss)
+    return _QSS_PUNCT_SPACE.sub(r"\1", qss).strip()
+
+
+@cache
+def _static_qss() -> str:
+    return _minify_qss(_STATIC_QSS)
+
+
+# Each theme's QSS is built on first use, so a dark-only session never formats
+# the light one; the palettes are read-only so the cached strings never go stale
+@cache
+def _dark_qss() -> str:
+    return get_stylesheet(DARK_COLORS)
+
+
+@cache
+def _light_qss() -> str:
+    return get_stylesheet(LIGHT_COLORS)
+
+
+_THEMES = {
+    "dark": _dark_qss,
+    "light": _light_qss,
+}
+
+
+def apply_theme(app, name: Literal["dark", "light"] = "dark"):
+    """Apply the named theme to QApplication."""
+    # Re-setting even an identical stylesheet re-polishes every widget
+    if getattr(app, "_panther_theme", None) == name:
+        return
+    app.setStyleSheet(_THEMES[name]())
+    app._panther_theme = name
+
+
 def apply_dark_theme(app):
     """Apply dark theme to QApplication."""
-    stylesheet = get_stylesheet(DARK_COLORS)
-    app.setStyleSheet(stylesheet)
+    apply_theme(app, "dark")
 
 
 def apply_light_theme(app):
     """Apply light theme to QApplication."""
-    stylesheet = get_stylesheet(LIGHT_COLORS)
-    app.setStyleSheet(stylesheet)
+    apply_theme(app, "light")
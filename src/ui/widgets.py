@@ -1,8 +1,18 @@
 """Custom UI widgets — panther orange resin theme."""
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QDesktopServices
+from typing import Optional
+
+from PyQt6.QtCore import (
+    QParallelAnimationGroup,
+    QPropertyAnimation,
+    QSequentialAnimationGroup,
+    Qt,
+    QTimer,
+    QUrl,
+)
+from PyQt6.QtGui import QColor, QDesktopServices, QPainter, QPixmap
 from PyQt6.QtWidgets import (
     QFrame,
+    QGraphicsOpacityEffect,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -20,160 +30,201 @@ class MessageBubble(QFrame):
     """Message bubble widget for chat.
 
     User messages: styled plain-text bubble (right-aligned).
-    AI messages: rich HTML via QTextBrowser with markdown, code, thinking (left-aligned).
+    AI messages: rich HTML with markdown, code, thinking (left-aligned). While
+    streaming this is a QTextBrowser; finalize() swaps it for a far lighter
+    rich-text QLabel once the text stops changing.
+
+    Styling lives in STYLESHEET, set once on the chat's messages container
+    rather than per bubble, so Qt parses it once however long the chat gets.
     """
 
-    def __init__(self, text: str, is_user: bool = False, parent=None):
+    STYLESHEET = """
+        MessageBubble {
+            background: transparent;
+        }
+        MessageBubble QLabel#userText {
+            background-color: #1e1a14;
+            border-radius: 16px;
+            border: 1px solid #2a2218;
+            padding: 12px 16px;
+            max-width: 700px;
+            color: #f0ece8;
+            font-size: 14px;
+            line-height: 1.5;
+        }
+        MessageBubble QLabel#roleLabel {
+            color: #FF6B35;
+            font-size: 12px;
+            font-weight: bold;
+            margin-bottom: 4px;
+            background: transparent;
+        }
+        MessageBubble QTextBrowser, MessageBubble QLabel#aiText {
+            background: transparent;
+            border: none;
+            color: #e8e0d8;
+            font-family: 'Inter', 'Segoe UI', sans-serif;
+            font-size: 14px;
+            selection-background-color: #FF6B35;
+        }
+    """
+
+    def __init__(self, text: str, is_user: bool = False, parent=None, streaming: bool = False):
         super().__init__(parent)
         self.text = text
         self.is_user = is_user
+        self.streaming = streaming and not is_user
+        self.text_browser: Optional[QTextBrowser] = None
         self._setup_ui()
 
     def _setup_ui(self):
         """Setup message bubble UI."""
         self.setObjectName("userMessage" if self.is_user else "aiMessage")
         self.setFrameShape(QFrame.Shape.NoFrame)
-        self.setStyleSheet("background: transparent;")
-
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(8)
 
+        # Children sit directly in the bubble's own layout (no inner
+        # container frame) to keep per-message widget and layout counts low
         if self.is_user:
-            # ── User message: right-aligned pill ──
-            main_layout.addSpacerItem(
+            # ── User message: right-aligned pill; the label is the pill ──
+            layout = QHBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(8)
+            layout.addSpacerItem(
                 QSpacerItem(100, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
             )
 
-            self.container = QFrame()
-            self.container.setObjectName("userMessage")
-            self.container.setStyleSheet("""
-                QFrame#userMessage {
-                    background-color: #1e1a14;
-                    border-radius: 16px;
-                    border: 1px solid #2a2218;
-                    padding: 0;
-                    max-width: 700px;
-                }
-            """)
-
-            container_layout = QVBoxLayout(self.container)
-            container_layout.setContentsMargins(16, 12, 16, 12)
-            container_layout.setSpacing(0)
-
             self.label = QLabel()
+            self.label.setObjectName("userText")
             self.label.setWordWrap(True)
             self.label.setTextFormat(Qt.TextFormat.RichText)
             self.label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-            self.label.setStyleSheet("""
-                QLabel {
-                    color: #f0ece8;
-                    font-size: 14px;
-                    line-height: 1.5;
-                    background: transparent;
-                }
-            """)
             self.label.setText(render_user_message(self.text))
-            container_layout.addWidget(self.label)
-
-            main_layout.addWidget(self.container)
+            layout.addWidget(self.label)
 
         else:
-            # ── AI message: full-width rich HTML ──
-            self.container = QFrame()
-            self.container.setObjectName("aiMessage")
-            self.container.setStyleSheet("""
-                QFrame#aiMessage {
-                    background: transparent;
-                    border: none;
-                    padding: 0;
-                }
-            """)
-
-            container_layout = QVBoxLayout(self.container)
-            container_layout.setContentsMargins(8, 4, 8, 4)
-            container_layout.setSpacing(0)
+            # ── AI message: full-width rich HTML, right margin as a gutter ──
+            layout = QVBoxLayout(self)
+            layout.setContentsMargins(8, 4, 56, 4)
+            layout.setSpacing(0)
+            self._ai_layout = layout
 
             # Role label — orange resin accent
             role_label = QLabel("✦ Assistant")
-            role_label.setStyleSheet("""
-                QLabel {
-                    color: #FF6B35;
-                    font-size: 12px;
-                    font-weight: bold;
-                    margin-bottom: 4px;
-                    background: transparent;
-                }
-            """)
-            container_layout.addWidget(role_label)
-
-            # Rich text browser
-            self.text_browser = QTextBrowser()
-            self.text_browser.setOpenExternalLinks(False)
-            self.text_browser.anchorClicked.connect(
-                lambda url: QDesktopServices.openUrl(url)
-            )
-            self.text_browser.setVerticalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            )
-            self.text_browser.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            )
-            self.text_browser.setStyleSheet("""
-                QTextBrowser {
-                    background: transparent;
-                    border: none;
-                    color: #e8e0d8;
-                    font-family: 'Inter', 'Segoe UI', sans-serif;
-                    font-size: 14px;
-                    selection-background-color: #FF6B35;
-                }
-            """)
-            self.text_browser.setSizePolicy(
-                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
-            )
-
-            # Set initial content
-            if self.text:
-                self.text_browser.setHtml(render_markdown(self.text))
-
-            # Auto-resize to content
-            self.text_browser.document().contentsChanged.connect(self._adjust_height)
-            self._adjust_height()
-
-            container_layout.addWidget(self.text_browser)
-
-            main_layout.addWidget(self.container)
+            role_label.setObjectName("roleLabel")
+            layout.addWidget(role_label)
+
+            if self.streaming:
+                # Rich text browser while the text keeps changing
+                self.text_browser = QTextBrowser()
+                self.text_browser.setOpenExternalLinks(False)
+                self.text_browser.anchorClicked.connect(
+                    lambda url: QDesktopServices.openUrl(url)
+                )
+                self.text_browser.setVerticalScrollBarPolicy(
+                    Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+                )
+                self.text_browser.setHorizontalScrollBarPolicy(
+                    Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+                )
+                self.text_browser.setSizePolicy(
+                    QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
+                )
 
-            # Right spacer for AI messages (leave some right margin)
-            main_layout.addSpacerItem(
-                QSpacerItem(40, 0, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
-            )
+                # Set initial content
+                if self.text:
+                    self.text_browser.setHtml(render_markdown(self.text))
+
+                # Auto-resize to content, at most once per ~frame: while streaming
+                # each resize relayouts the chat. set_text is the only thing that
+                # changes the document, so it triggers this rather than
+                # contentsChanged (which also fires on internal document edits)
+                self._adjust_timer = QTimer(self)
+                self._adjust_timer.setSingleShot(True)
+                self._adjust_timer.setInterval(33)
+                self._adjust_timer.timeout.connect(self._do_adjust_height)
+                self._adjust_height()
+
+                layout.addWidget(self.text_browser)
+            else:
+                self.label = self._create_text_label()
+                layout.addWidget(self.label)
+
+    def _create_text_label(self) -> QLabel:
+        """Rich-text label for a finished AI message; sizes itself to its text."""
+        label = QLabel()
+        label.setObjectName("aiText")
+        label.setWordWrap(True)
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        label.setOpenExternalLinks(False)
+        label.linkActivated.connect(lambda url: QDesktopServices.openUrl(QUrl(url)))
+        label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        if self.text:
+            label.setText(render_markdown(self.text))
+        return label
+
+    def finalize(self):
+        """Swap the streaming QTextBrowser for a QLabel once the text is final."""
+        if self.text_browser is None:
+            return
+        self._adjust_timer.stop()
+        self.label = self._create_text_label()
+        self._ai_layout.replaceWidget(self.text_browser, self.label)
+        self.text_browser.deleteLater()
+        self.text_browser = None
+        self.streaming = False
 
     def _adjust_height(self):
+        """Schedule a resize of the QTextBrowser to fit its content."""
+        if self.text_browser is not None and not self._adjust_timer.isActive():
+            self._adjust_timer.start()
+
+    def _do_adjust_height(self):
         """Auto-resize QTextBrowser to fit content without scrollbar."""
-        if hasattr(self, "text_browser"):
-            doc_height = self.text_browser.document().size().toSize().height()
-            self.text_browser.setFixedHeight(max(doc_height + 10, 30))
+        if self.text_browser is None:
+            return
+        doc_height = self.text_browser.document().size().toSize().height()
+        self.text_browser.setFixedHeight(max(doc_height + 10, 30))
 
     def set_text(self, text: str):
         """Update message text."""
+        if text == self.text:
+            return
         self.text = text
         if self.is_user:
             self.label.setText(render_user_message(text))
-        else:
+        elif self.text_browser is not None:
             self.text_browser.setHtml(render_markdown(text))
             self._adjust_height()
+        else:
+            self.label.setText(render_markdown(text))
 
 
 class TypingIndicator(QFrame):
     """Typing indicator with animated orange dots."""
 
+    # Dot pixmap shared by every indicator; built on first use since a
+    # QPixmap needs the QApplication to exist
+    _dot_pixmap = None
+
+    @classmethod
+    def _get_dot_pixmap(cls) -> QPixmap:
+        if cls._dot_pixmap is None:
+            pixmap = QPixmap(8, 8)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#FF6B35"))
+            painter.drawEllipse(0, 0, 8, 8)
+            painter.end()
+            cls._dot_pixmap = pixmap
+        return cls._dot_pixmap
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._dots = 0
         self._setup_ui()
-        self._setup_timer()
+        self._setup_animation()
 
     def _setup_ui(self):
         """Setup typing indicator UI."""
@@ -182,9 +233,11 @@ class TypingIndicator(QFrame):
 
         # Container — warm dark with orange tint
         container = QFrame()
+        container.setObjectName("typingBubble")
+        # Scoped by name: an unscoped QFrame rule would also hit the dot QLabels
         container.setStyleSheet(
             """
-            QFrame {
+            QFrame#typingBubble {
                 background-color: #1a1510;
                 border-radius: 14px;
                 border: 1px solid #2a2218;
@@ -197,21 +250,17 @@ class TypingIndicator(QFrame):
         container_layout.setContentsMargins(12, 8, 12, 8)
         container_layout.setSpacing(6)
 
-        # Dots — orange resin
-        self.dot_labels = []
-        for i in range(3):
-            dot = QLabel("")
+        # Dots — orange resin, faded in and out through an opacity effect
+        self.dot_effects = []
+        for _ in range(3):
+            dot = QLabel()
             dot.setFixedSize(8, 8)
-            dot.setStyleSheet(
-                f"""
-                QLabel {{
-                    background-color: {'#FF6B35' if i == 0 else '#3a2818'};
-                    border-radius: 4px;
-                }}
-            """
-            )
+            dot.setPixmap(self._get_dot_pixmap())
+            effect = QGraphicsOpacityEffect(dot)
+            effect.setOpacity(0.25)
+            dot.setGraphicsEffect(effect)
             container_layout.addWidget(dot)
-            self.dot_labels.append(dot)
+            self.dot_effects.append(effect)
 
         layout.addWidget(container)
         layout.addStretch()
@@ -219,45 +268,31 @@ class TypingIndicator(QFrame):
         self.setStyleSheet("background: transparent;")
         self.setFrameShape(QFrame.Shape.NoFrame)
 
-    def _setup_timer(self):
-        """Setup animation timer."""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._animate)
-        self.timer.start(400)
-
-    def _animate(self):
-        """Animate typing dots with orange resin glow."""
-        self._dots = (self._dots + 1) % 4
-
-        for i, dot in enumerate(self.dot_labels):
-            if i < self._dots:
-                dot.setStyleSheet(
-                    """
-                    QLabel {
-                        background-color: #FF6B35;
-                        border-radius: 4px;
-                    }
-                """
-                )
-            else:
-                dot.setStyleSheet(
-                    """
-                    QLabel {
-                        background-color: #3a2818;
-                        border-radius: 4px;
-                    }
-                """
-                )
+    def _setup_animation(self):
+        """Setup the looping dot pulse, driven by Qt's animation timer."""
+        self.animation = QParallelAnimationGroup(self)
+        for i, effect in enumerate(self.dot_effects):
+            pulse = QPropertyAnimation(effect, b"opacity")
+            pulse.setDuration(1200)
+            pulse.setKeyValueAt(0.0, 0.25)
+            pulse.setKeyValueAt(0.5, 1.0)
+            pulse.setKeyValueAt(1.0, 0.25)
+            pulse.setLoopCount(-1)
+            # Stagger the dots so the glow travels left to right
+            staggered = QSequentialAnimationGroup()
+            staggered.addPause(i * 130)
+            staggered.addAnimation(pulse)
+            self.animation.addAnimation(staggered)
 
     def showEvent(self, event):
         """Handle show event."""
         super().showEvent(event)
-        self.timer.start()
+        self.animation.start()
 
     def hideEvent(self, event):
         """Handle hide event."""
         super().hideEvent(event)
-        self.timer.stop()
+        self.animation.stop()
 
 
 class SessionItem(QWidget):
@@ -10,7 +10,9 @@ BEFORE they enter the URL resolution pipeline.
   Layer 3 — Gemini LLM (universal, ~1s)
 """
 
+import asyncio
 import re
+from functools import lru_cache
 from typing import Optional
 from loguru import logger
 
@@ -27,17 +29,18 @@ except ImportError:
 #  Layer 1 — Fast Heuristics (spacing, case, possessives)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_POSSESSIVE_RE = re.compile(r"['\u2019]s$")
+_WS_RE = re.compile(r"\s+")
+
+
 def _heuristic_clean(brand: str) -> str:
     """Basic cleaning — runs in <0.1ms."""
-    # Lowercase + strip
-    cleaned = brand.strip().lower()
-    # Remove possessives
-    cleaned = re.sub(r"['']s$", "", cleaned)
-    # Remove trailing punctuation
-    cleaned = cleaned.rstrip(".,!?;:")
+    # Lowercase + strip, then drop trailing punctuation so "nike's." loses both
+    cleaned = brand.strip().lower().rstrip(".,!?;:")
+    # Remove possessives (straight or curly apostrophe)
+    cleaned = _POSSESSIVE_RE.sub("", cleaned)
     # Collapse multiple spaces to single
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    return _WS_RE.sub(" ", cleaned).strip()
 
 
 def _try_space_collapse(brand: str) -> str:
@@ -55,21 +58,41 @@ def _try_space_collapse(brand: str) -> str:
 #  Layer 2 — rapidfuzz vs SITE_MAP (known sites, <1ms)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_KNOWN_SITES_CACHE: Optional[list[str]] = None
+_KNOWN_SITES_SET: frozenset[str] = frozenset()
+
+
+def _get_known_sites() -> list[str]:
+    """SITE_MAP keys, imported and listed once (SITE_MAP is never mutated)."""
+    global _KNOWN_SITES_CACHE, _KNOWN_SITES_SET
+    if _KNOWN_SITES_CACHE is None:
+        try:
+            from src.capabilities.desktop_browser_agent import SITE_MAP
+        except ImportError:
+            return []
+        # Insertion order kept: extractOne breaks score ties by position
+        _KNOWN_SITES_CACHE = list(SITE_MAP)
+        _KNOWN_SITES_SET = frozenset(SITE_MAP)
+    return _KNOWN_SITES_CACHE
+
+
+def _get_known_sites_set() -> frozenset[str]:
+    """SITE_MAP keys as a set, for O(1) exact-hit checks."""
+    _get_known_sites()
+    return _KNOWN_SITES_SET
+
+
 def _fuzzy_match_known_sites(brand: str, score_cutoff: int = 80) -> Optional[str]:
     """
     Fuzzy match against SITE_MAP keys.
-    Uses token_sort_ratio for word-order independence.
+    Uses token_sort_ratio for word-order independence on multi-word input,
+    plain ratio (identical score for one word) otherwise.
     Returns the matched site name or None.
     """
     if not HAS_RAPIDFUZZ:
         return None
 
-    try:
-        from src.capabilities.desktop_browser_agent import SITE_MAP
-        known_sites = list(SITE_MAP.keys())
-    except ImportError:
-        return None
-
+    known_sites = _get_known_sites()
     if not known_sites:
         return None
 
@@ -80,10 +103,17 @@ def _fuzzy_match_known_sites(brand: str, score_cutoff: int = 80) -> Optional[str
         candidates_to_try.append(collapsed)
 
     for candidate in candidates_to_try:
+        # For one word token sorting is a no-op, so plain ratio scores the
+        # same without the split/sort/join; "net flix" still gets token_sort
+        scorer = fuzz.token_sort_ratio if " " in candidate else fuzz.ratio
         result = rf_process.extractOne(
             candidate,
             known_sites,
-            scorer=fuzz.token_sort_ratio,
+            scorer=scorer,
+            # Both sides are already lower-cased and space-normalised (the
+            # query by _heuristic_clean, the keys by SITE_MAP convention), so
+            # skip rapidfuzz's per-choice default_process (the 2.x default)
+            processor=None,
             score_cutoff=score_cutoff,
         )
         if result:
@@ -94,10 +124,40 @@ def _fuzzy_match_known_sites(brand: str, score_cutoff: int = 80) -> Optional[str
     return None
 
 
+@lru_cache(maxsize=1024)
+def _match_known_site(cleaned: str) -> Optional[str]:
+    """
+    Layer 2 for a heuristic-cleaned brand: exact SITE_MAP hit, then fuzzy.
+    Memoized since users keep typing the same handful of brands.
+    """
+    known = _get_known_sites_set()
+    if cleaned in known:
+        return cleaned
+    collapsed = _try_space_collapse(cleaned)
+    if collapsed in known:
+        return collapsed
+
+    fuzzy_match = _fuzzy_match_known_sites(cleaned)
+    if fuzzy_match:
+        return fuzzy_match
+
+    # Also try space-collapsed version against SITE_MAP
+    if collapsed != cleaned:
+        return _fuzzy_match_known_sites(collapsed)
+    return None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Layer 3 — Gemini LLM (universal, ~1s)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Successful corrections by cleaned brand; oldest entry evicted when full
+_GEMINI_CACHE: dict[str, str] = {}
+_GEMINI_CACHE_SIZE = 256
+# Requests currently awaiting Gemini, by cleaned brand
+_GEMINI_INFLIGHT: dict[str, asyncio.Future] = {}
+
+
 async def _gemini_normalize(brand: str, gemini_model) -> Optional[str]:
     """
     Ask Gemini to correct the brand name.
@@ -128,6 +188,35 @@ async def _gemini_normalize(brand: str, gemini_model) -> Optional[str]:
         return None
 
 
+async def _gemini_normalize_shared(brand: str, gemini_model) -> Optional[str]:
+    """
+    _gemini_normalize with caching, and with concurrent calls for the same
+    brand (e.g. a user retrying) sharing one in-flight request.
+    """
+    if brand in _GEMINI_CACHE:
+        return _GEMINI_CACHE[brand]
+    pending = _GEMINI_INFLIGHT.get(brand)
+    if pending is not None:
+        # Shielded so a cancelled waiter doesn't cancel the shared request
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _GEMINI_INFLIGHT[brand] = future
+    try:
+        result = await _gemini_normalize(brand, gemini_model)
+        if result:
+            if len(_GEMINI_CACHE) >= _GEMINI_CACHE_SIZE:
+                _GEMINI_CACHE.pop(next(iter(_GEMINI_CACHE)))
+            _GEMINI_CACHE[brand] = result
+        future.set_result(result)
+        return result
+    finally:
+        _GEMINI_INFLIGHT.pop(brand, None)
+        if not future.done():
+            # The owning call was cancelled; waiters fall back to Layer 1
+            future.set_result(None)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Main Entry Point
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -160,24 +249,17 @@ async def normalize_brand(raw: str, gemini_model=None) -> str:
     if not cleaned:
         return raw
 
-    # ── Layer 2: rapidfuzz vs SITE_MAP ────────────────────────────────────
-    fuzzy_match = _fuzzy_match_known_sites(cleaned)
-    if fuzzy_match:
-        return fuzzy_match
-
-    # Also try space-collapsed version against SITE_MAP
-    collapsed = _try_space_collapse(cleaned)
-    if collapsed != cleaned:
-        fuzzy_collapsed = _fuzzy_match_known_sites(collapsed)
-        if fuzzy_collapsed:
-            return fuzzy_collapsed
+    # ── Layer 2: SITE_MAP (memoized) ──────────────────────────────────────
+    site_match = _match_known_site(cleaned)
+    if site_match:
+        return site_match
 
     # ── Layer 3: Gemini LLM (universal fallback) ──────────────────────────
     # Only invoke if the brand looks potentially misspelled:
     # - Short names (< 15 chars) are more likely brands
     # - Names without dots (not already a domain)
     if gemini_model and "." not in cleaned and len(cleaned) < 30:
-        gemini_result = await _gemini_normalize(cleaned, gemini_model)
+        gemini_result = await _gemini_normalize_shared(cleaned, gemini_model)
         if gemini_result:
             return gemini_result
 
@@ -0,0 +1,63 @@
+"""Tests for the brand name normalizer."""
+import asyncio
+
+import pytest
+
+from src.utils.brand_normalizer import _heuristic_clean, normalize_brand
+
+
+class _CountingModel:
+    """Gemini stand-in that always answers with a fixed brand."""
+
+    def __init__(self, answer: str):
+        self.answer = answer
+        self.calls = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0)  # yield so concurrent callers overlap
+        return type("Response", (), {"text": self.answer})()
+
+
+def test_heuristic_clean():
+    """Test case, possessive, punctuation and whitespace cleanup."""
+    assert _heuristic_clean("  Nike's. ") == "nike"
+    assert _heuristic_clean("Nike’s") == "nike"
+    assert _heuristic_clean("net   flix!") == "net flix"
+
+
+@pytest.mark.asyncio
+async def test_exact_site_hit_skips_later_layers():
+    """Test that known sites resolve without fuzzy matching or Gemini."""
+    model = _CountingModel("wrong")
+    assert await normalize_brand("YouTube", model) == "youtube"
+    assert await normalize_brand("you tube", model) == "youtube"
+    assert model.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_short_input_passes_through():
+    """Test that single-character input is returned unchanged."""
+    assert await normalize_brand("X") == "X"
+
+
+@pytest.mark.asyncio
+async def test_gemini_correction_is_reused():
+    """Test that a repeated unknown brand asks Gemini only once."""
+    model = _CountingModel("Zara")
+    assert await normalize_brand("zarra", model) == "zara"
+    assert await normalize_brand("Zarra!", model) == "zara"
+    assert model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gemini_requests_are_coalesced():
+    """Test that simultaneous lookups of one brand share a Gemini call."""
+    model = _CountingModel("Uniqlo")
+    results = await asyncio.gather(
+        normalize_brand("uniqloo", model),
+        normalize_brand("Uniqloo", model),
+        normalize_brand("uniqloo.", model),
+    )
+    assert results == ["uniqlo"] * 3
+    assert model.calls == 1
@@ -0,0 +1,136 @@
+"""Tests for TaskPlanner."""
+
+from src.core.task_planner import AgentTask, TaskPlanner, TaskStatus, TaskStep
+
+
+def _add_task(planner: TaskPlanner, steps: int = 2) -> AgentTask:
+    task = AgentTask(
+        goal="Test goal",
+        steps=[TaskStep(description=f"Step {i + 1}") for i in range(steps)],
+    )
+    planner.active_tasks[task.task_id] = task
+    return task
+
+
+class TestTaskPlannerVersion:
+    def test_version_advances_on_step_progress(self):
+        planner = TaskPlanner()
+        task = _add_task(planner)
+
+        v0 = planner.version
+        planner.start_task(task)
+        v1 = planner.version
+        planner.complete_step(task, "done")
+        v2 = planner.version
+
+        assert v0 < v1 < v2
+
+    def test_version_advances_when_task_finishes(self):
+        planner = TaskPlanner()
+        task = _add_task(planner, steps=1)
+        planner.start_task(task)
+
+        before = planner.version
+        planner.complete_step(task)
+
+        assert task.status == TaskStatus.COMPLETED
+        assert task in planner.completed_tasks
+        assert planner.version > before
+
+    def test_version_advances_on_cancel_only_for_known_task(self):
+        planner = TaskPlanner()
+        task = _add_task(planner)
+
+        before = planner.version
+        planner.cancel_task("missing")
+        assert planner.version == before
+
+        planner.cancel_task(task.task_id)
+        assert planner.version > before
+
+
+class TestTaskPlannerCallbacks:
+    def test_callbacks_fire_on_change(self):
+        planner = TaskPlanner()
+        calls = []
+        planner.on_tasks_changed(lambda: calls.append(planner.version))
+        task = _add_task(planner)
+
+        planner.start_task(task)
+
+        assert calls == [planner.version]
+
+    def test_removed_callback_not_called(self):
+        planner = TaskPlanner()
+        calls = []
+
+        def callback():
+            calls.append(1)
+
+        planner.on_tasks_changed(callback)
+        planner.remove_tasks_changed_callback(callback)
+        planner.remove_tasks_changed_callback(callback)  # no error when absent
+        planner.start_task(_add_task(planner))
+
+        assert calls == []
+
+    def test_finishing_step_notifies_once(self):
+        planner = TaskPlanner()
+        done = _add_task(planner, steps=1)
+        failed = _add_task(planner)
+        planner.start_task(done)
+        planner.start_task(failed)
+        calls = []
+        planner.on_tasks_changed(lambda: calls.append(1))
+
+        before = planner.version
+        planner.complete_step(done)
+        planner.fail_step(failed, "boom")
+
+        assert calls == [1, 1]
+        assert planner.version == before + 2
+
+    def test_failing_callback_does_not_break_planner(self):
+        planner = TaskPlanner()
+        planner.on_tasks_changed(lambda: 1 / 0)
+        task = _add_task(planner, steps=1)
+
+        planner.start_task(task)
+        planner.complete_step(task)
+
+        assert task.status == TaskStatus.COMPLETED
+
+
+class TestTaskPlannerGetTask:
+    def test_get_active_and_completed_task(self):
+        planner = TaskPlanner()
+        active = _add_task(planner)
+        done = _add_task(planner, steps=1)
+        planner.start_task(done)
+        planner.complete_step(done)
+
+        assert planner.get_task(active.task_id) is active
+        assert planner.get_task(done.task_id) is done
+        assert planner.get_task("missing") is None
+
+    def test_trimmed_completed_task_is_forgotten(self):
+        planner = TaskPlanner()
+        tasks = [_add_task(planner) for _ in range(51)]
+        for task in tasks:
+            planner.cancel_task(task.task_id)
+        planner.fail_step(_add_task(planner), "boom")
+
+        assert planner.get_task(tasks[0].task_id) is None
+        assert planner.get_task(tasks[-1].task_id) is tasks[-1]
+
+
+class TestAgentTaskListLabel:
+    def test_label_follows_status(self):
+        task = AgentTask(goal="x" * 60)
+
+        pending = task.list_label
+        assert pending == "○ " + "x" * 40
+        assert task.list_label is pending  # cached while unchanged
+
+        task.status = TaskStatus.COMPLETED
+        assert task.list_label == "✓ " + "x" * 40